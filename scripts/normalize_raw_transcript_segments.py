@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 SPEAKER_TIMESTAMP_RE = re.compile(
     r"^(?P<speaker>[^:\n]{1,120}):\s*(?:\[\s*|\(\s*)?"
     r"(?P<timestamp>(?:\d{1,2}:)?\d{1,2}:\d{2})(?:\s*\]|\s*\))?\s*$"
 )
-WHITESPACE_RE = re.compile(r"\s+")
 VERSION_SUFFIX_RE = re.compile(r"__v\d+$")
 
 
@@ -42,6 +45,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str, fallback: str = "unknown") -> str:
     """Convert text into an ASCII slug."""
     ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
@@ -51,20 +55,23 @@ def slugify(value: str, fallback: str = "unknown") -> str:
 
 def parse_timestamp_to_seconds(timestamp: str) -> int:
     """Parse mm:ss or hh:mm:ss timestamp into total seconds."""
-    parts = [int(part) for part in timestamp.split(":")]
-    if len(parts) == 2:
-        minutes, seconds = parts
-        return minutes * 60 + seconds
-    if len(parts) == 3:
-        hours, minutes, seconds = parts
-        return hours * 3600 + minutes * 60 + seconds
-    raise ValueError(f"Unsupported timestamp format: {timestamp}")
+    # Slice on colon offsets rather than building a list of parts; int() still rejects bad digits.
+    first_colon = timestamp.find(":")
+    second_colon = timestamp.find(":", first_colon + 1) if first_colon != -1 else -1
+    if first_colon == -1 or (second_colon != -1 and timestamp.find(":", second_colon + 1) != -1):
+        raise ValueError(f"Unsupported timestamp format: {timestamp}")
+    if second_colon == -1:
+        return int(timestamp[:first_colon]) * 60 + int(timestamp[first_colon + 1 :])
+    return (
+        int(timestamp[:first_colon]) * 3600
+        + int(timestamp[first_colon + 1 : second_colon]) * 60
+        + int(timestamp[second_colon + 1 :])
+    )
 
 
-def normalize_segment_text(lines: list[str]) -> str:
+def normalize_segment_text(text: str) -> str:
     """Join multi-line utterances into a single normalized text block."""
-    pieces = [line.strip() for line in lines if line.strip()]
-    return WHITESPACE_RE.sub(" ", " ".join(pieces)).strip()
+    return " ".join(text.split())
 
 
 def extract_segments(raw_text: str) -> list[dict[str, Any]]:
@@ -80,7 +87,7 @@ def extract_segments(raw_text: str) -> list[dict[str, Any]]:
         if current_speaker is None or current_start is None:
             return
 
-        text = normalize_segment_text(current_text_lines)
+        text = normalize_segment_text(" ".join(current_text_lines))
         if text:
             segments.append(
                 {
@@ -156,16 +163,13 @@ def normalize_document(data: dict[str, Any]) -> dict[str, Any]:
 
 def convert_file(input_path: Path, output_dir: Path) -> Path:
     """Convert a raw transcript JSON file and write normalized output."""
-    with input_path.open("r", encoding="utf-8") as file:
-        raw_data = json.load(file)
+    raw_data = orjson.loads(input_path.read_bytes())
 
     normalized = normalize_document(raw_data)
 
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / input_path.name
-    with output_path.open("w", encoding="utf-8") as file:
-        json.dump(normalized, file, indent=2, ensure_ascii=False)
-        file.write("\n")
+    output_path.write_bytes(orjson.dumps(normalized, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
     return output_path
 
@@ -186,9 +190,11 @@ def main() -> int:
         print("No input JSON files found.")
         return 1
 
-    for input_path in input_files:
-        output_path = convert_file(input_path, args.output_dir)
-        print(f"Converted {input_path} -> {output_path}")
+    # Files share no state, so fan out across processes; map keeps output order deterministic.
+    with ProcessPoolExecutor() as executor:
+        output_paths = executor.map(convert_file, input_files, repeat(args.output_dir))
+        for input_path, output_path in zip(input_files, output_paths):
+            print(f"Converted {input_path} -> {output_path}")
 
     return 0
 
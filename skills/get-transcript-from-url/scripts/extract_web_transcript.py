@@ -4,20 +4,33 @@
 from __future__ import annotations
 
 import argparse
+import calendar
+import copy
+import functools
 import json
 import re
 import sys
 import unicodedata
+from collections.abc import Iterator
 from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
+import orjson
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    # Pure-Python fallback keeps the script usable when lxml is not installed.
+    HTML_PARSER = "html.parser"
+
 
 TIMESTAMP_RE = re.compile(r"(?:\[\s*|\(\s*)?(?:\d{1,2}:)?\d{1,2}:\d{2}(?:\s*\]|\s*\))?")
-WHITESPACE_RE = re.compile(r"\s+")
 SPEAKER_TIMESTAMP_LINE_RE = re.compile(
     r"^[^:\n]{1,80}:\s*(?:\[\s*|\(\s*)?(?:\d{1,2}:)?\d{1,2}:\d{2}(?:\s*\]|\s*\))?(?:\s|$)"
 )
@@ -48,6 +61,15 @@ NOISE_PREFIXES = (
     "sponsored",
 )
 
+CHALLENGE_MARKERS = (
+    "enable javascript and cookies to continue",
+    "cf-challenge",
+    "just a moment...",
+    "_cf_chl_opt",
+    "attention required!",
+    "please stand by, while we are checking your browser",
+)
+
 REMOVAL_SELECTORS = (
     "script",
     "style",
@@ -65,6 +87,9 @@ REMOVAL_SELECTORS = (
     ".share-buttons",
 )
 
+# Compile CSS selectors once; soupsieve otherwise re-parses them on every `select` call.
+REMOVAL_COMPILED = tuple(sv.compile(selector) for selector in REMOVAL_SELECTORS)
+
 TAIL_CUTOFF_MARKERS = (
     "we use cookies to improve your experience",
     "privacy and cookie policy",
@@ -78,15 +103,17 @@ TAIL_CUTOFF_MARKERS = (
     "open live chat",
 )
 
-TAIL_CUTOFF_EXACT_LINES = (
-    "explore",
-    "mobility challenges",
-    "live q&as with kelly",
-    "upcoming events",
-    "pain protocols",
-    "professional courses",
-    "mobility gear",
-    "join our newsletter",
+TAIL_CUTOFF_EXACT_LINES = frozenset(
+    {
+        "explore",
+        "mobility challenges",
+        "live q&as with kelly",
+        "upcoming events",
+        "pain protocols",
+        "professional courses",
+        "mobility gear",
+        "join our newsletter",
+    }
 )
 
 CANDIDATE_SELECTORS = (
@@ -103,6 +130,9 @@ CANDIDATE_SELECTORS = (
     "body",
 )
 
+CANDIDATE_COMPILED = tuple((sv.compile(selector), selector) for selector in CANDIDATE_SELECTORS)
+JSON_LD_SCRIPT_COMPILED = sv.compile('script[type="application/ld+json"]')
+
 DATE_CANDIDATE_KEYS = (
     "datePublished",
     "uploadDate",
@@ -115,6 +145,19 @@ TITLE_CANDIDATE_KEYS = (
     "name",
 )
 
+# One pass over the `%B %d, %Y` / `%b %d, %Y`, `%m/%d/%Y` / `%d/%m/%Y`, and `%Y.%m.%d` date shapes.
+DATE_FALLBACK_RE = re.compile(
+    r"(?P<month_name>[A-Za-z]+)\s+(?P<name_day>\d{1,2}),\s+(?P<name_year>\d{4})"
+    r"|(?P<first>\d{1,2})/(?P<second>\d{1,2})/(?P<slash_year>\d{4})"
+    r"|(?P<dot_year>\d{4})\.(?P<dot_month>\d{1,2})\.(?P<dot_day>\d{1,2})"
+)
+MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+
 
 class TranscriptExtractionError(RuntimeError):
     """Raised when transcript extraction fails."""
@@ -180,6 +223,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str, fallback: str = "unknown") -> str:
     ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     slug = re.sub(r"[^a-zA-Z0-9]+", "-", ascii_value.lower()).strip("-")
@@ -187,7 +231,7 @@ def slugify(value: str, fallback: str = "unknown") -> str:
 
 
 def normalize_line(line: str) -> str:
-    return WHITESPACE_RE.sub(" ", line).strip()
+    return " ".join(line.split())
 
 
 def should_drop_line(line: str) -> bool:
@@ -201,26 +245,24 @@ def should_drop_line(line: str) -> bool:
 
 def is_challenge_page(html: str) -> bool:
     lower = html.lower()
-    markers = (
-        "enable javascript and cookies to continue",
-        "cf-challenge",
-        "just a moment...",
-        "_cf_chl_opt",
-        "attention required!",
-        "please stand by, while we are checking your browser",
-    )
-    return any(marker in lower for marker in markers)
+    return any(marker in lower for marker in CHALLENGE_MARKERS)
 
 
-def fetch_html(url: str, timeout: int) -> str:
-    headers = {
+# Module-level so repeated direct fetches reuse keep-alive connections.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update(
+    {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/132.0.0.0 Safari/537.36"
         )
     }
-    response = requests.get(url, headers=headers, timeout=timeout)
+)
+
+
+def fetch_html(url: str, timeout: int) -> str:
+    response = HTTP_SESSION.get(url, timeout=timeout)
     response.raise_for_status()
     return response.text
 
@@ -257,8 +299,10 @@ def fetch_html_with_cloudscraper(url: str, timeout: int) -> str:
 
 def parse_json_ld(soup: BeautifulSoup) -> list[dict]:
     parsed: list[dict] = []
-    for script_tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        raw = script_tag.string or script_tag.get_text(strip=True)
+    for script_tag in JSON_LD_SCRIPT_COMPILED.select(soup):
+        raw = script_tag.string
+        if raw is None:
+            raw = script_tag.get_text()
         if not raw:
             continue
         try:
@@ -269,18 +313,16 @@ def parse_json_ld(soup: BeautifulSoup) -> list[dict]:
     return parsed
 
 
-def flatten_json_ld(payload: object) -> list[dict]:
-    items: list[dict] = []
+def flatten_json_ld(payload: object) -> Iterator[dict]:
     if isinstance(payload, dict):
-        items.append(payload)
+        yield payload
         graph = payload.get("@graph")
         if isinstance(graph, list):
             for item in graph:
-                items.extend(flatten_json_ld(item))
+                yield from flatten_json_ld(item)
     elif isinstance(payload, list):
         for item in payload:
-            items.extend(flatten_json_ld(item))
-    return [item for item in items if isinstance(item, dict)]
+            yield from flatten_json_ld(item)
 
 
 def first_non_empty(values: list[str | None]) -> str | None:
@@ -312,19 +354,30 @@ def normalize_date(raw: str | None) -> str | None:
     except ValueError:
         pass
 
-    for fmt in (
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y.%m.%d",
-    ):
+    fallback = DATE_FALLBACK_RE.fullmatch(value)
+    if fallback is None:
+        return None
+
+    if fallback.group("month_name"):
+        month = MONTH_NUMBERS.get(fallback.group("month_name").lower())
+        if month is None:
+            return None
+        candidates = [(int(fallback.group("name_year")), month, int(fallback.group("name_day")))]
+    elif fallback.group("slash_year"):
+        year = int(fallback.group("slash_year"))
+        first, second = int(fallback.group("first")), int(fallback.group("second"))
+        # Month-first wins, matching the previous `%m/%d/%Y` before `%d/%m/%Y` order.
+        candidates = [(year, first, second), (year, second, first)]
+    else:
+        candidates = [
+            (int(fallback.group("dot_year")), int(fallback.group("dot_month")), int(fallback.group("dot_day")))
+        ]
+
+    for year, month, day in candidates:
         try:
-            parsed = datetime.strptime(value, fmt)
-            return parsed.date().isoformat()
+            return date(year, month, day).isoformat()
         except ValueError:
             continue
-
     return None
 
 
@@ -460,9 +513,10 @@ def infer_metadata(
 
 
 def cleaned_text_from_node(node: Tag) -> str:
-    cloned = BeautifulSoup(str(node), "html.parser")
-    for selector in REMOVAL_SELECTORS:
-        for removable in cloned.select(selector):
+    # Copy the in-memory tree instead of serializing and re-parsing the node HTML.
+    cloned = copy.copy(node)
+    for compiled in REMOVAL_COMPILED:
+        for removable in compiled.select(cloned):
             removable.decompose()
 
     lines: list[str] = []
@@ -511,8 +565,8 @@ def extract_transcript_text(soup: BeautifulSoup, selector: str | None) -> str:
     best_score = -10**9
 
     seen_nodes: set[int] = set()
-    for candidate_selector in CANDIDATE_SELECTORS:
-        for node in soup.select(candidate_selector):
+    for compiled, candidate_selector in CANDIDATE_COMPILED:
+        for node in compiled.select(soup):
             node_id = id(node)
             if node_id in seen_nodes:
                 continue
@@ -536,10 +590,6 @@ def extract_transcript_text(soup: BeautifulSoup, selector: str | None) -> str:
     return best_text
 
 
-def find_timestamp_line_indexes(lines: list[str]) -> list[int]:
-    return [idx for idx, line in enumerate(lines) if TIMESTAMP_RE.search(line)]
-
-
 def find_transcript_start(lines: list[str], timestamp_indexes: list[int]) -> int | None:
     if len(timestamp_indexes) < 3:
         return None
@@ -571,13 +621,18 @@ def find_transcript_end(lines: list[str], timestamp_indexes: list[int]) -> int |
 
 
 def trim_transcript_noise(text: str) -> str:
-    lines = [normalize_line(line) for line in text.splitlines()]
-    lines = [line for line in lines if line]
+    lines: list[str] = []
+    timestamp_indexes: list[int] = []
+    for raw_line in text.splitlines():
+        line = normalize_line(raw_line)
+        if not line:
+            continue
+        if TIMESTAMP_RE.search(line):
+            timestamp_indexes.append(len(lines))
+        lines.append(line)
     if not lines:
         return text
 
-    timestamp_indexes = find_timestamp_line_indexes(lines)
-
     start_idx = find_transcript_start(lines, timestamp_indexes)
     if start_idx is not None and start_idx > 0:
         lines = lines[start_idx:]
@@ -664,7 +719,7 @@ def main() -> int:
             )
             return 1
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     try:
         podcast_name, episode_title, published_date = infer_metadata(
@@ -717,7 +772,7 @@ def main() -> int:
         "raw": transcript_text,
     }
 
-    output_path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    output_path.write_bytes(orjson.dumps(document, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
     print(f"Wrote {output_path}")
     print(
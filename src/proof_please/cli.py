@@ -3,31 +3,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
+from secrets import token_hex
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-
-from proof_please.config import AppConfig
-from proof_please.core.io import load_claims_jsonl, write_jsonl
-from proof_please.core.printing import print_claim_rows, print_query_rows
-from proof_please.db import get_connection, init_schema
-from proof_please.pipeline.models import ModelBackendConfig
-from proof_please.pipeline.pipeline_runner import (
-    fetch_available_models,
-    find_missing_models,
-    parse_model_list,
-    run_claim_extraction,
-    run_query_generation,
-    validate_common_args,
-    validate_path_exists,
-)
+
+# Heavy imports (pydantic-settings, DuckDB, pipeline/model stack) are deferred into the
+# command bodies so `--help` and shell completion do not pay for them.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from proof_please.pipeline.models import ModelBackendConfig
 
 app = typer.Typer(
     no_args_is_help=True,
     help="Commands for transcript claim extraction and validation-query generation.",
 )
-console = Console()
 
 DEFAULT_INPUT = Path("data/transcripts/norm/web__the-ready-state__layne-norton__2022-10-20__v1.json")
 DEFAULT_OUTPUT = Path("data/claims.jsonl")
@@ -101,6 +92,16 @@ QUERY_CHUNK_OVERLAP_OPTION = typer.Option(
     "--query-chunk-overlap",
     help="Claims overlap between query-generation chunks.",
 )
+CONCURRENCY_OPTION = typer.Option(
+    1,
+    "--concurrency",
+    help="Concurrent model backend requests during claim extraction.",
+)
+CACHE_DIR_OPTION = typer.Option(
+    None,
+    "--cache-dir",
+    help="Directory for cached model responses during claim extraction (default: no cache).",
+)
 LIST_CLAIMS_OPTION = typer.Option(
     True,
     "--list-claims/--no-list-claims",
@@ -113,32 +114,69 @@ LIST_QUERIES_OPTION = typer.Option(
 )
 
 
+def _console() -> Console:
+    # Consoles are cheap to build; importing rich here keeps it out of `--help` startup.
+    from rich.console import Console
+
+    return Console()
+
+
 def _status(message: str) -> None:
-    console.print(f"[dim]{message}[/dim]")
+    _console().print(f"[dim]{message}[/dim]")
 
 
 def _to_bad_parameter(exc: Exception) -> typer.BadParameter:
     return typer.BadParameter(str(exc))
 
 
+def _to_runtime_exit(exc: Exception) -> typer.Exit:
+    # Runtime failures (missing files, unreachable backend) are not usage errors,
+    # so report them directly instead of re-rendering the command usage.
+    from rich.markup import escape
+
+    _console().print(f"[red]Error:[/red] {escape(str(exc))}")
+    return typer.Exit(code=1)
+
+
 def _backend_config(backend_url: str, timeout: float) -> ModelBackendConfig:
+    from proof_please.pipeline.models import ModelBackendConfig
+
     return ModelBackendConfig(base_url=backend_url, timeout=timeout)
 
 
 @app.command("config")
 def show_config() -> None:
     """Print the current app configuration."""
-    cfg = AppConfig()
+    from proof_please.config import get_app_config
+
+    console = _console()
+    cfg = get_app_config()
     console.print(f"[bold]DuckDB path:[/bold] {cfg.duckdb_path}")
+    # Unset values fall back to DuckDB's own defaults.
+    console.print(f"[bold]DuckDB threads:[/bold] {cfg.duckdb_threads or 'DuckDB default'}")
+    console.print(f"[bold]DuckDB memory limit:[/bold] {cfg.duckdb_memory_limit or 'DuckDB default'}")
 
 
 @app.command("init-db")
 def initialize_database() -> None:
     """Create the initial DuckDB database and schema."""
-    cfg = AppConfig()
-    with get_connection(cfg.duckdb_path) as conn:
-        init_schema(conn)
-    console.print(f"[green]Initialized DuckDB:[/green] {cfg.duckdb_path}")
+    import duckdb
+    from pydantic import ValidationError
+
+    from proof_please.config import get_app_config
+    from proof_please.db import get_connection, init_schema
+
+    try:
+        cfg = get_app_config()
+        with get_connection(
+            cfg.duckdb_path,
+            threads=cfg.duckdb_threads,
+            memory_limit=cfg.duckdb_memory_limit,
+        ) as conn:
+            init_schema(conn)
+    except (ValidationError, duckdb.Error) as exc:
+        raise _to_runtime_exit(exc) from exc
+    _console().print(f"[green]Initialized DuckDB:[/green] {cfg.duckdb_path}")
 
 
 @app.command("extract-claims")
@@ -151,9 +189,22 @@ def extract_claims_command(
     max_segments: int = MAX_SEGMENTS_OPTION,
     chunk_size: int = CHUNK_SIZE_OPTION,
     chunk_overlap: int = CHUNK_OVERLAP_OPTION,
+    concurrency: int = CONCURRENCY_OPTION,
+    cache_dir: Path | None = CACHE_DIR_OPTION,
     list_claims: bool = LIST_CLAIMS_OPTION,
 ) -> None:
     """Extract claims from transcript segments and write claims JSONL."""
+    from proof_please.core.io import write_jsonl
+    from proof_please.core.printing import print_claim_rows
+    from proof_please.pipeline.pipeline_runner import (
+        fetch_available_models,
+        find_missing_models,
+        parse_model_list,
+        run_claim_extraction,
+        validate_common_args,
+    )
+
+    console = _console()
     model_list = parse_model_list(models)
 
     try:
@@ -167,7 +218,7 @@ def extract_claims_command(
         if missing_models:
             console.print(f"[yellow]Requested models not found in model list: {missing_models}[/yellow]")
 
-        run_id = f"run_{uuid4().hex[:12]}"
+        run_id = f"run_{token_hex(6)}"
         all_rows = run_claim_extraction(
             transcript=transcript,
             model_list=model_list,
@@ -177,9 +228,13 @@ def extract_claims_command(
             chunk_overlap=chunk_overlap,
             on_status=_status,
             run_id=run_id,
+            concurrency=concurrency,
+            cache_dir=cache_dir,
         )
-    except (ValueError, FileNotFoundError, ConnectionError) as exc:
+    except ValueError as exc:
         raise _to_bad_parameter(exc) from exc
+    except (FileNotFoundError, ConnectionError) as exc:
+        raise _to_runtime_exit(exc) from exc
 
     write_jsonl(output, all_rows)
     console.print(f"[bold green]Wrote {len(all_rows)} claims to {output}[/bold green]")
@@ -200,6 +255,18 @@ def generate_queries_command(
     list_queries: bool = LIST_QUERIES_OPTION,
 ) -> None:
     """Generate validation queries from an existing claims JSONL file."""
+    from proof_please.core.io import load_claims_jsonl, write_jsonl
+    from proof_please.core.printing import print_query_rows
+    from proof_please.pipeline.pipeline_runner import (
+        fetch_available_models,
+        find_missing_models,
+        parse_model_list,
+        run_query_generation,
+        validate_common_args,
+        validate_path_exists,
+    )
+
+    console = _console()
     model_list = parse_model_list(models)
 
     try:
@@ -214,7 +281,7 @@ def generate_queries_command(
 
         claims = load_claims_jsonl(claims_input)
         console.print(f"[green]Loaded {len(claims)} claims from {claims_input}[/green]")
-        run_id = f"run_{uuid4().hex[:12]}"
+        run_id = f"run_{token_hex(6)}"
         query_rows = run_query_generation(
             claims=claims,
             config=config,
@@ -226,8 +293,10 @@ def generate_queries_command(
             on_status=_status,
             run_id=run_id,
         )
-    except (ValueError, FileNotFoundError, ConnectionError) as exc:
+    except ValueError as exc:
         raise _to_bad_parameter(exc) from exc
+    except (FileNotFoundError, ConnectionError) as exc:
+        raise _to_runtime_exit(exc) from exc
 
     write_jsonl(queries_output, query_rows)
     console.print(
@@ -251,10 +320,24 @@ def run_pipeline_command(
     chunk_overlap: int = CHUNK_OVERLAP_OPTION,
     query_chunk_size: int = QUERY_CHUNK_SIZE_OPTION,
     query_chunk_overlap: int = QUERY_CHUNK_OVERLAP_OPTION,
+    concurrency: int = CONCURRENCY_OPTION,
+    cache_dir: Path | None = CACHE_DIR_OPTION,
     list_claims: bool = LIST_CLAIMS_OPTION,
     list_queries: bool = LIST_QUERIES_OPTION,
 ) -> None:
     """Run extraction and query generation end-to-end."""
+    from proof_please.core.io import write_jsonl
+    from proof_please.core.printing import print_claim_rows, print_query_rows
+    from proof_please.pipeline.pipeline_runner import (
+        fetch_available_models,
+        find_missing_models,
+        parse_model_list,
+        run_claim_extraction,
+        run_query_generation,
+        validate_common_args,
+    )
+
+    console = _console()
     model_list = parse_model_list(models)
 
     try:
@@ -273,7 +356,7 @@ def run_pipeline_command(
                     "None of the requested models are available. Update --models or install one locally."
                 )
 
-        run_id = f"run_{uuid4().hex[:12]}"
+        run_id = f"run_{token_hex(6)}"
         all_rows = run_claim_extraction(
             transcript=transcript,
             model_list=model_list,
@@ -283,6 +366,8 @@ def run_pipeline_command(
             chunk_overlap=chunk_overlap,
             on_status=_status,
             run_id=run_id,
+            concurrency=concurrency,
+            cache_dir=cache_dir,
         )
         query_rows = run_query_generation(
             claims=all_rows,
@@ -295,8 +380,10 @@ def run_pipeline_command(
             on_status=_status,
             run_id=run_id,
         )
-    except (ValueError, FileNotFoundError, ConnectionError) as exc:
+    except ValueError as exc:
         raise _to_bad_parameter(exc) from exc
+    except (FileNotFoundError, ConnectionError) as exc:
+        raise _to_runtime_exit(exc) from exc
 
     write_jsonl(output, all_rows)
     console.print(f"[bold green]Wrote {len(all_rows)} claims to {output}[/bold green]")
@@ -1,5 +1,7 @@
 """Runtime configuration objects."""
 
+import functools
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,3 +16,13 @@ class AppConfig(BaseSettings):
     )
 
     duckdb_path: str = Field(default="data/proof_please.duckdb")
+    # None leaves each setting to DuckDB's own default (all cores, about 80% of RAM).
+    duckdb_threads: int | None = Field(default=None, ge=1)
+    # Passed through as-is; DuckDB validates it when init-db opens the connection.
+    duckdb_memory_limit: str | None = Field(default=None)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Return process-wide settings, reading env vars and `.env` only once."""
+    return AppConfig()
@@ -1,10 +1,17 @@
 """Core adapters and shared utilities."""
 
 from proof_please.core.io import extract_json_object, load_claims_jsonl, load_transcript, write_jsonl
-from proof_please.core.model_client import chat_with_model, list_available_models
+from proof_please.core.model_client import (
+    ModelBackendError,
+    ModelBackendHTTPError,
+    chat_with_model,
+    list_available_models,
+)
 from proof_please.core.printing import print_claim_rows, print_query_rows
 
 __all__ = [
+    "ModelBackendError",
+    "ModelBackendHTTPError",
     "chat_with_model",
     "extract_json_object",
     "list_available_models",
@@ -7,15 +7,27 @@ import re
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from proof_please.pipeline.models import TranscriptDocument
 
+JSONL_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def extract_json_object(text: str) -> dict[str, Any]:
     """Extract the last JSON object from a text response."""
     cleaned = text.strip()
     if cleaned.startswith("```"):
         cleaned = re.sub(r"^```[a-zA-Z]*", "", cleaned)
-        cleaned = cleaned.replace("```", "")
+        cleaned = cleaned.replace("```", "").strip()
+    # Well-behaved responses are a single JSON object; parse those directly and only
+    # scan for embedded objects when the text carries commentary around the JSON.
+    try:
+        direct = orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
+        direct = None
+    if isinstance(direct, dict):
+        return direct
     decoder = json.JSONDecoder()
     idx = 0
     last_obj: dict[str, Any] | None = None
@@ -38,12 +50,12 @@ def extract_json_object(text: str) -> dict[str, Any]:
 def load_claims_jsonl(path: Path) -> list[dict[str, Any]]:
     """Load claims from JSONL."""
     claims: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as file:
+    # orjson parses the raw UTF-8 bytes of each line, skipping the str decode step.
+    with path.open("rb") as file:
         for line in file:
-            stripped = line.strip()
-            if not stripped:
+            if not line.strip():
                 continue
-            row = json.loads(stripped)
+            row = orjson.loads(line)
             if isinstance(row, dict):
                 claims.append(row)
     return claims
@@ -65,7 +77,6 @@ def load_transcript(path: Path) -> tuple[str, list[dict[str, Any]]]:
 def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
     """Write rows to JSONL."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        for row in rows:
-            file.write(json.dumps(row, ensure_ascii=False))
-            file.write("\n")
+    # A 1 MiB buffer batches many rows per write syscall.
+    with path.open("wb", buffering=JSONL_WRITE_BUFFER_SIZE) as file:
+        file.writelines(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
@@ -2,28 +2,136 @@
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
-from typing import Any
+import threading
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 from proof_please.pipeline.models import ModelBackendConfig
 
+HTTP_POOL_SIZE = 32
+
+MODEL_LIST_PATHS = ("/v1/models", "/api/tags")
+
+# Chat request variants in fallback order; only model/messages change per call.
+CHAT_VARIANTS: tuple[tuple[str, dict[str, Any]], ...] = (
+    (
+        "/v1/chat/completions",
+        {"temperature": 0.0, "max_tokens": 1200, "response_format": {"type": "json_object"}},
+    ),
+    ("/v1/chat/completions", {"temperature": 0.0, "max_tokens": 1200}),
+    (
+        "/api/chat",
+        {
+            "stream": False,
+            "think": False,
+            "format": "json",
+            "options": {"temperature": 0.0, "num_predict": 1200},
+        },
+    ),
+)
+
+
+class ModelBackendError(RuntimeError):
+    """Raised when the model backend cannot be reached or rejects a request."""
+
+
+class ModelBackendHTTPError(ModelBackendError):
+    """Model backend answered with an HTTP error status."""
+
+    def __init__(self, url: str, status_code: int, reason: str, body: str) -> None:
+        detail = f": {body[:200]}" if body else ""
+        super().__init__(f"HTTP {status_code} {reason} from {url}{detail}")
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+
 
 def _endpoint(base_url: str, path: str) -> str:
     return f"{base_url.rstrip('/')}{path}"
 
 
+# One keep-alive pool reuses backend sockets across every call in a run; urllib3's
+# connection pools are thread-safe, so every thread's session can mount the same adapter.
+# Size the pool for concurrent extraction so parallel calls keep their sockets.
+_HTTP_ADAPTER = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+
+
+_thread_state = threading.local()
+
+
+def _http_session() -> requests.Session:
+    # requests.Session is not documented as thread-safe, so each extraction worker gets its own.
+    session: requests.Session | None = getattr(_thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        session.mount("http://", _HTTP_ADAPTER)
+        session.mount("https://", _HTTP_ADAPTER)
+        _thread_state.session = session
+    return session
+
+
+class _RouteCache:
+    """Remember which endpoint variant last worked for each backend route."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._winners: dict[tuple[str, str], int] = {}
+
+    def get(self, base_url: str, kind: str) -> int | None:
+        with self._lock:
+            return self._winners.get((base_url, kind))
+
+    def remember(self, base_url: str, kind: str, index: int) -> None:
+        with self._lock:
+            self._winners[(base_url, kind)] = index
+
+    def forget(self, base_url: str, kind: str) -> None:
+        with self._lock:
+            self._winners.pop((base_url, kind), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._winners.clear()
+
+
+# Shared process-wide so every extraction thread skips variants another call already ruled out.
+_ROUTE_CACHE = _RouteCache()
+
+
+_Candidate = TypeVar("_Candidate")
+
+
+def _preferred_order(
+    base_url: str,
+    kind: str,
+    candidates: Sequence[_Candidate],
+) -> list[tuple[int, _Candidate]]:
+    # Try the last winning variant first; the rest keep their fallback order.
+    indexed = list(enumerate(candidates))
+    winner = _ROUTE_CACHE.get(base_url, kind)
+    if winner is None:
+        return indexed
+    return [indexed[winner], *(item for item in indexed if item[0] != winner)]
+
+
 def _request_json(url: str, timeout: float, method: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method=method,
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        body = json.load(resp)
+    data = orjson.dumps(payload) if payload is not None else None
+    try:
+        resp = _http_session().request(method, url, data=data, timeout=timeout)
+    except ValueError:
+        # Malformed base URLs (MissingSchema, InvalidURL) are usage errors, not connection failures.
+        raise
+    except requests.RequestException as exc:
+        raise ModelBackendError(f"Request to {url} failed: {exc}") from exc
+    with resp:
+        if resp.status_code >= 400:
+            raise ModelBackendHTTPError(url, resp.status_code, resp.reason or "", resp.text)
+        body = orjson.loads(resp.content)
     if not isinstance(body, dict):
         raise ValueError("Model backend returned non-object JSON response.")
     return body
@@ -56,24 +164,26 @@ def _parse_model_names(payload: dict[str, Any]) -> list[str]:
 
 def list_available_models(config: ModelBackendConfig) -> list[str]:
     """Fetch available model names from OpenAI-compatible or legacy endpoints."""
-    endpoints = ("/v1/models", "/api/tags")
-    last_http_error: urllib.error.HTTPError | None = None
+    last_http_error: ModelBackendHTTPError | None = None
     had_successful_probe = False
-    for path in endpoints:
+    for index, path in _preferred_order(config.base_url, "models", MODEL_LIST_PATHS):
         try:
             payload = _request_json(
                 url=_endpoint(config.base_url, path),
                 timeout=config.timeout,
                 method="GET",
             )
-        except urllib.error.HTTPError as exc:
-            if exc.code == 404:
+        except ModelBackendHTTPError as exc:
+            if exc.status_code >= 500:
+                _ROUTE_CACHE.forget(config.base_url, "models")
+            if exc.status_code == 404:
                 last_http_error = exc
                 continue
             raise
         had_successful_probe = True
         names = _parse_model_names(payload)
         if names:
+            _ROUTE_CACHE.remember(config.base_url, "models", index)
             return names
     if had_successful_probe:
         return []
@@ -116,55 +226,37 @@ def chat_with_model(
     messages: list[dict[str, str]],
 ) -> str:
     """Call the model backend and return chat-completion text."""
-    openai_payload = {
-        "model": model,
-        "messages": messages,
-        "temperature": 0.0,
-        "max_tokens": 1200,
-        "response_format": {"type": "json_object"},
-    }
-    legacy_payload = {
-        "model": model,
-        "messages": messages,
-        "stream": False,
-        "think": False,
-        "format": "json",
-        "options": {"temperature": 0.0, "num_predict": 1200},
-    }
-
-    openai_payload_no_format = {
-        "model": model,
-        "messages": messages,
-        "temperature": 0.0,
-        "max_tokens": 1200,
-    }
-    endpoints: list[tuple[str, dict[str, Any]]] = [
-        ("/v1/chat/completions", openai_payload),
-        ("/v1/chat/completions", openai_payload_no_format),
-        ("/api/chat", legacy_payload),
-    ]
-    last_http_error: urllib.error.HTTPError | None = None
+    last_http_error: ModelBackendHTTPError | None = None
     last_content_error: ValueError | None = None
     had_successful_probe = False
-    for path, payload in endpoints:
+    # Routes are per model, so one model's quirks never reroute another model's calls.
+    route = f"chat:{model}"
+    for index, (path, payload_options) in _preferred_order(config.base_url, route, CHAT_VARIANTS):
         try:
             response = _request_json(
                 url=_endpoint(config.base_url, path),
                 timeout=config.timeout,
                 method="POST",
-                payload=payload,
+                payload={"model": model, "messages": messages, **payload_options},
             )
-        except urllib.error.HTTPError as exc:
-            if exc.code in (400, 404):
+        except ModelBackendHTTPError as exc:
+            if exc.status_code >= 500:
+                _ROUTE_CACHE.forget(config.base_url, route)
+            if exc.status_code in (400, 404):
                 last_http_error = exc
                 continue
             raise
         had_successful_probe = True
         try:
-            return _extract_chat_content(response)
+            content = _extract_chat_content(response)
         except ValueError as exc:
             last_content_error = exc
             continue
+        # Only an endpoint-level fallback (400/404) is sticky; a one-off empty or malformed
+        # reply must not switch later calls away from the JSON-mode variant.
+        if last_content_error is None:
+            _ROUTE_CACHE.remember(config.base_url, route, index)
+        return content
 
     if had_successful_probe and last_content_error is not None:
         raise last_content_error
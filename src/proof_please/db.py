@@ -5,11 +5,21 @@ from pathlib import Path
 import duckdb
 
 
-def get_connection(db_path: str) -> duckdb.DuckDBPyConnection:
+def get_connection(
+    db_path: str,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+) -> duckdb.DuckDBPyConnection:
     """Create a DuckDB connection, ensuring the parent folder exists."""
     path = Path(db_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    return duckdb.connect(str(path))
+    # Unset values keep DuckDB's own defaults.
+    settings: dict[str, str | int] = {}
+    if threads is not None:
+        settings["threads"] = threads
+    if memory_limit is not None:
+        settings["memory_limit"] = memory_limit
+    return duckdb.connect(str(path), config=settings)
 
 
 def init_schema(conn: duckdb.DuckDBPyConnection) -> None:
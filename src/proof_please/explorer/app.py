@@ -7,14 +7,23 @@ from pathlib import Path
 import streamlit as st
 
 from proof_please.explorer.data_access import ExplorerDataset, load_dataset
-from proof_please.explorer.linking import compute_link_diagnostics
+from proof_please.explorer.linking import LinkDiagnostics, compute_link_diagnostics
 from proof_please.explorer.styles import APP_STYLE
+from proof_please.explorer.view_logic import (
+    DebugTabsIndex,
+    DiagnosticsTables,
+    EpisodeBrowserIndex,
+    build_debug_tabs_index,
+    build_diagnostics_tables,
+    build_episode_browser_index,
+)
 from proof_please.explorer.views import (
     render_claims_tab,
     render_diagnostics_tab,
     render_episode_browser,
     render_hero,
     render_queries_tab,
+    reset_diagnostics_paging,
 )
 
 DEFAULT_CLAIMS_PATH = "data/claims.jsonl"
@@ -35,6 +44,57 @@ def _load_dataset_cached(
     )
 
 
+@st.cache_resource(show_spinner=False)
+def _build_browser_index_cached(
+    claims_path: str,
+    queries_path: str,
+    transcripts_path: str,
+) -> EpisodeBrowserIndex:
+    # cache_resource returns the same object on every rerun instead of unpickling a copy;
+    # views only read from it.
+    dataset = _load_dataset_cached(claims_path, queries_path, transcripts_path)
+    return build_episode_browser_index(
+        dataset.transcripts_by_doc_id,
+        dataset.claims,
+        dataset.queries,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_debug_index_cached(
+    claims_path: str,
+    queries_path: str,
+    transcripts_path: str,
+) -> DebugTabsIndex:
+    dataset = _load_dataset_cached(claims_path, queries_path, transcripts_path)
+    return build_debug_tabs_index(dataset.claims, dataset.queries)
+
+
+@st.cache_resource(show_spinner=False)
+def _compute_diagnostics_cached(
+    claims_path: str,
+    queries_path: str,
+    transcripts_path: str,
+) -> LinkDiagnostics:
+    dataset = _load_dataset_cached(claims_path, queries_path, transcripts_path)
+    return compute_link_diagnostics(
+        claims=dataset.claims,
+        queries=dataset.queries,
+        transcripts_by_doc_id=dataset.transcripts_by_doc_id,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_diagnostics_tables_cached(
+    claims_path: str,
+    queries_path: str,
+    transcripts_path: str,
+) -> DiagnosticsTables:
+    return build_diagnostics_tables(
+        _compute_diagnostics_cached(claims_path, queries_path, transcripts_path)
+    )
+
+
 def main() -> None:
     """Run the Streamlit explorer app."""
     st.set_page_config(
@@ -55,6 +115,12 @@ def main() -> None:
         )
         if st.button("Reload from disk", width="stretch", type="primary"):
             _load_dataset_cached.clear()
+            _build_browser_index_cached.clear()
+            _build_debug_index_cached.clear()
+            _compute_diagnostics_cached.clear()
+            _build_diagnostics_tables_cached.clear()
+            # Paging counters belong to the old issue tables, not the reloaded ones.
+            reset_diagnostics_paging()
         st.caption("Paths are resolved from the current working directory.")
 
     try:
@@ -63,12 +129,6 @@ def main() -> None:
         st.error(f"Could not load explorer dataset: {exc}")
         st.stop()
 
-    diagnostics = compute_link_diagnostics(
-        claims=dataset.claims,
-        queries=dataset.queries,
-        transcripts_by_doc_id=dataset.transcripts_by_doc_id,
-    )
-
     if "pp_mode" not in st.session_state:
         st.session_state["pp_mode"] = "Episode Browser"
 
@@ -82,9 +142,13 @@ def main() -> None:
     )
 
     if mode == "Episode Browser":
-        render_episode_browser(dataset)
+        render_episode_browser(
+            dataset,
+            _build_browser_index_cached(claims_path, queries_path, transcripts_path),
+        )
         return
 
+    diagnostics = _compute_diagnostics_cached(claims_path, queries_path, transcripts_path)
     render_hero(diagnostics)
     debug_sections = ["Claims", "Queries", "Diagnostics"]
     if st.session_state.get("pp_debug_section") not in debug_sections:
@@ -97,11 +161,21 @@ def main() -> None:
         horizontal=True,
     )
     if debug_section == "Claims":
-        render_claims_tab(dataset)
+        render_claims_tab(
+            dataset,
+            _build_debug_index_cached(claims_path, queries_path, transcripts_path),
+        )
     elif debug_section == "Queries":
-        render_queries_tab(dataset)
+        render_queries_tab(
+            dataset,
+            _build_debug_index_cached(claims_path, queries_path, transcripts_path),
+        )
     else:
-        render_diagnostics_tab(dataset, diagnostics)
+        render_diagnostics_tab(
+            dataset,
+            diagnostics,
+            _build_diagnostics_tables_cached(claims_path, queries_path, transcripts_path),
+        )
 
 
 if __name__ == "__main__":
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
 def _normalize_text(value: Any) -> str:
@@ -33,7 +34,11 @@ class EvidenceRow(BaseModel):
 
 
 class ClaimRow(BaseModel):
-    """Explorer-friendly claim row parsed from claims JSONL."""
+    """Explorer-friendly claim row parsed from claims JSONL.
+
+    Search text is computed once at validation; build changed rows with `model_validate`,
+    since field assignment and `model_copy(update=...)` leave it stale.
+    """
 
     model_config = ConfigDict(extra="allow")
 
@@ -47,6 +52,27 @@ class ClaimRow(BaseModel):
     evidence: list[EvidenceRow] = Field(default_factory=list)
     time_range_s: dict[str, int] = Field(default_factory=dict)
 
+    _search_blob: str = PrivateAttr(default="")
+    _claim_text_search: str = PrivateAttr(default="")
+
+    @property
+    def search_blob(self) -> str:
+        """Case-folded text matched by claim search, built at validation time."""
+        return self._search_blob
+
+    @property
+    def claim_text_search(self) -> str:
+        """Case-folded claim text matched by linked-query search, built at validation time."""
+        return self._claim_text_search
+
+    @model_validator(mode="after")
+    def _build_search_text(self) -> ClaimRow:
+        self._search_blob = " ".join(
+            [self.claim_id, self.doc_id, self.speaker, self.claim_type, self.claim_text]
+        ).casefold()
+        self._claim_text_search = self.claim_text.casefold()
+        return self
+
     @field_validator(
         "claim_id",
         "doc_id",
@@ -67,6 +93,11 @@ class ClaimRow(BaseModel):
             raise ValueError("Required claim field is empty.")
         return value
 
+    @field_validator("doc_id", "speaker", "claim_type", "model")
+    @classmethod
+    def _intern_low_cardinality_fields(cls, value: str) -> str:
+        return sys.intern(value)
+
     @field_validator("boldness_rating", mode="before")
     @classmethod
     def _normalize_boldness_rating(cls, value: Any) -> int | None:
@@ -94,7 +125,11 @@ class ClaimRow(BaseModel):
 
 
 class QueryRow(BaseModel):
-    """Explorer-friendly validation-query row parsed from query JSONL."""
+    """Explorer-friendly validation-query row parsed from query JSONL.
+
+    Search text is computed once at validation; build changed rows with `model_validate`,
+    since field assignment and `model_copy(update=...)` leave it stale.
+    """
 
     model_config = ConfigDict(extra="allow")
 
@@ -103,6 +138,18 @@ class QueryRow(BaseModel):
     why_this_query: str = ""
     preferred_sources: list[str] = Field(default_factory=list)
 
+    _search_blob: str = PrivateAttr(default="")
+
+    @property
+    def search_blob(self) -> str:
+        """Case-folded text matched by query search, built at validation time."""
+        return self._search_blob
+
+    @model_validator(mode="after")
+    def _build_search_text(self) -> QueryRow:
+        self._search_blob = " ".join([self.query, self.why_this_query]).casefold()
+        return self
+
     @field_validator("claim_id", "query", "why_this_query", mode="before")
     @classmethod
     def _normalize_text_fields(cls, value: Any) -> str:
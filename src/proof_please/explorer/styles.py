@@ -407,6 +407,12 @@ h1, h2, h3 {
     line-height: 1.35;
 }
 
+details.query-card > summary {
+    cursor: pointer;
+    color: var(--pp-ink) !important;
+    font-size: 0.95rem;
+}
+
 @keyframes riseIn {
     from {
         opacity: 0;
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import heapq
+import html
+import re
 from collections import Counter, defaultdict
-from dataclasses import dataclass
-from urllib.parse import urlparse
-
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from proof_please.explorer.linking import (
+    LinkDiagnostics,
+    index_claims_by_id,
+)
 from proof_please.explorer.models import ClaimRow, QueryRow
 from proof_please.pipeline.models import TranscriptDocument
 
 PREVIEW_LIMIT = 96
-SegmentKey = tuple[str, str]
+PREVIEW_ELLIPSIS = "..."
+PREVIEW_CACHE_SIZE = 4096
+TIMESTAMP_CACHE_SIZE = 8192
+# Captures the URL authority (what urlparse reports as netloc) without building a SplitResult.
+URL_NETLOC_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpisodeOption:
     """Display metadata for episode selection controls."""
 
@@ -26,7 +38,7 @@ class EpisodeOption:
     query_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceGroup:
     """Episodes grouped under a source key."""
 
@@ -35,7 +47,7 @@ class SourceGroup:
     episode_doc_ids: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpisodeClaimRow:
     """Compact claim row rendered in episode-first controls."""
 
@@ -47,9 +59,24 @@ class EpisodeClaimRow:
     boldness_rating: int | None
     query_count: int
     first_seg_id: str
+    # Case-folded id, speaker, claim type and text, matched as one string by the browser search.
+    search_blob: str = field(default="", repr=False, compare=False)
+    # (start, end) offsets of the id, speaker and text inside search_blob; the "Find claim"
+    # picker matches each field on its own and skips the claim type.
+    picker_spans: tuple[tuple[int, int], ...] = field(default=(), repr=False, compare=False)
+
 
+@dataclass(frozen=True, slots=True)
+class SegmentMarkup:
+    """HTML-escaped display fields for one transcript segment."""
+
+    seg_id: str
+    timestamp: str
+    speaker: str
+    text: str
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SourceSummary:
     """High-level source summary shown in the episode browser."""
 
@@ -59,6 +86,59 @@ class SourceSummary:
     top_speakers: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class EpisodeBrowserIndex:
+    """Dataset-wide lookups for the episode browser, built once per loaded dataset."""
+
+    queries_by_claim_id: dict[str, list[QueryRow]]
+    claims_by_doc_and_id: dict[tuple[str, str], ClaimRow]
+    segment_to_claims: dict[str, dict[str, list[ClaimRow]]]
+    source_groups: list[SourceGroup]
+    episodes_by_doc_id: dict[str, EpisodeOption]
+    segment_ids_by_doc_id: dict[str, frozenset[str]]
+    segment_search_texts: dict[str, tuple[str, ...]]
+    segment_markup: dict[str, tuple[SegmentMarkup, ...]]
+    episode_rows_by_doc_id: dict[str, list[EpisodeClaimRow]]
+    source_summaries: dict[str, SourceSummary]
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedQuery:
+    """Query row paired with its resolved claim and case-folded search haystack."""
+
+    query: QueryRow
+    linked_claim: ClaimRow | None
+    # Query text joined with the linked claim text, so search phrases may span the two.
+    search_blob: str = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class DebugTabsIndex:
+    """Dataset-wide lookups for the Debug Mode tabs, built once per loaded dataset."""
+
+    claims: list[ClaimRow]
+    claims_by_doc_id: dict[str, list[ClaimRow]]
+    queries_by_claim_id: dict[str, list[QueryRow]]
+    linked_queries: list[LinkedQuery]
+    doc_ids: tuple[str, ...]
+    speakers: tuple[str, ...]
+    claim_types: tuple[str, ...]
+    models: tuple[str, ...]
+    preferred_sources: tuple[str, ...]
+    claim_labels: dict[tuple[str, str], str]
+
+
+@dataclass(frozen=True, slots=True)
+class DiagnosticsTables:
+    """Column-oriented issue tables for the Diagnostics tab, built once per loaded dataset."""
+
+    orphan_queries: dict[str, list[str]]
+    claims_without_queries: dict[str, list[str]]
+    claims_missing_transcript_doc: dict[str, list[str]]
+    claims_without_evidence: dict[str, list[str]]
+    missing_evidence_links: dict[str, list[str]]
+
+
 def _normalize_text(value: object) -> str:
     return str(value or "").strip()
 
@@ -66,9 +146,9 @@ def _normalize_text(value: object) -> str:
 def _source_key_for_document(document: TranscriptDocument) -> str:
     source = document.source if isinstance(document.source, dict) else {}
     source_url = _normalize_text(source.get("url", ""))
-    if source_url:
-        parsed = urlparse(source_url)
-        host = parsed.netloc.lower().strip()
+    netloc_match = URL_NETLOC_RE.match(source_url)
+    if netloc_match:
+        host = netloc_match.group(1).lower().strip()
         if host.startswith("www."):
             host = host[4:]
         if host:
@@ -80,15 +160,41 @@ def _source_key_for_document(document: TranscriptDocument) -> str:
     return "unknown_source"
 
 
-def _episode_title_for_document(document: TranscriptDocument) -> str:
+def _document_labels(document: TranscriptDocument) -> tuple[str, str, str]:
+    """Return `(source_key, episode_title, published_date)` for one document."""
     episode = document.episode if isinstance(document.episode, dict) else {}
-    title = _normalize_text(episode.get("title", ""))
-    return title or document.doc_id
+    title = _normalize_text(episode.get("title", "")) or document.doc_id
+    published_date = _normalize_text(episode.get("published_date", ""))
+    return _source_key_for_document(document), title, published_date
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_timestamp(seconds: int) -> str:
+    """Format a second offset as MM:SS, or HH:MM:SS past the first hour."""
+    total_seconds = max(int(seconds), 0)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def build_segment_markup(document: TranscriptDocument) -> tuple[SegmentMarkup, ...]:
+    """Escape each segment's display fields once, in document order."""
+    return tuple(
+        SegmentMarkup(
+            seg_id=html.escape(segment.seg_id),
+            timestamp=format_timestamp(segment.start_time_s),
+            speaker=html.escape(segment.speaker or "Unknown speaker"),
+            text=html.escape(segment.text),
+        )
+        for segment in document.segments
+    )
 
 
-def _published_date_for_document(document: TranscriptDocument) -> str:
-    episode = document.episode if isinstance(document.episode, dict) else {}
-    return _normalize_text(episode.get("published_date", ""))
+def normalize_search_text(search_text: str) -> str:
+    """Normalize a search box value once, before it is matched against many rows."""
+    return search_text.strip().casefold()
 
 
 def episode_option_label(option: EpisodeOption) -> str:
@@ -100,6 +206,12 @@ def episode_option_label(option: EpisodeOption) -> str:
     )
 
 
+def claim_option_label(claim: ClaimRow) -> str:
+    """Build the selectbox label for a claim row."""
+    speaker = claim.speaker or "Unknown speaker"
+    return f"{claim.claim_id} | {speaker} | {truncate_preview(claim.claim_text)}"
+
+
 def build_claims_to_queries_index(queries: list[QueryRow]) -> dict[str, list[QueryRow]]:
     """Group query rows by claim_id."""
     grouped: dict[str, list[QueryRow]] = defaultdict(list)
@@ -108,20 +220,19 @@ def build_claims_to_queries_index(queries: list[QueryRow]) -> dict[str, list[Que
     return dict(grouped)
 
 
-def build_segment_to_claims_index(claims: list[ClaimRow]) -> dict[SegmentKey, list[ClaimRow]]:
-    """Index claims by (doc_id, seg_id) evidence references."""
-    index: dict[SegmentKey, list[ClaimRow]] = defaultdict(list)
-    for claim in claims:
+def build_segment_to_claims_index(
+    claims: list[ClaimRow],
+) -> dict[str, dict[str, list[ClaimRow]]]:
+    """Index claims by doc_id, then by evidence seg_id."""
+    index: dict[str, dict[str, list[ClaimRow]]] = {}
+    # One sort up front keeps every bucket in claim_id order as rows are appended.
+    for claim in sorted(claims, key=lambda row: row.claim_id):
         for evidence in claim.evidence:
             seg_id = _normalize_text(evidence.seg_id)
             if not seg_id:
                 continue
-            index[(claim.doc_id, seg_id)].append(claim)
-
-    return {
-        key: sorted(rows, key=lambda row: row.claim_id)
-        for key, rows in index.items()
-    }
+            index.setdefault(claim.doc_id, {}).setdefault(seg_id, []).append(claim)
+    return index
 
 
 def build_source_episode_index(
@@ -134,22 +245,22 @@ def build_source_episode_index(
     for claim in claims:
         claims_by_doc_id[claim.doc_id].append(claim)
 
-    queries_by_claim_id = build_claims_to_queries_index(queries)
+    query_counts = Counter(query.claim_id for query in queries)
 
     episodes_by_doc_id: dict[str, EpisodeOption] = {}
     source_to_doc_ids: dict[str, list[str]] = defaultdict(list)
     for doc_id, document in sorted(transcripts_by_doc_id.items()):
-        source_key = _source_key_for_document(document)
+        source_key, episode_title, published_date = _document_labels(document)
         source_to_doc_ids[source_key].append(doc_id)
 
         doc_claims = claims_by_doc_id.get(doc_id, [])
-        query_count = sum(len(queries_by_claim_id.get(row.claim_id, [])) for row in doc_claims)
+        query_count = sum(query_counts[row.claim_id] for row in doc_claims)
         episodes_by_doc_id[doc_id] = EpisodeOption(
             doc_id=doc_id,
             source_key=source_key,
             source_label=source_key,
-            episode_title=_episode_title_for_document(document),
-            published_date=_published_date_for_document(document),
+            episode_title=episode_title,
+            published_date=published_date,
             claim_count=len(doc_claims),
             query_count=query_count,
         )
@@ -177,6 +288,172 @@ def build_source_episode_index(
     return source_groups, episodes_by_doc_id
 
 
+def build_episode_browser_index(
+    transcripts_by_doc_id: dict[str, TranscriptDocument],
+    claims: list[ClaimRow],
+    queries: list[QueryRow],
+) -> EpisodeBrowserIndex:
+    """Build every dataset-wide grouping the episode browser reads on each rerun."""
+    source_groups, episodes_by_doc_id = build_source_episode_index(
+        transcripts_by_doc_id,
+        claims,
+        queries,
+    )
+    queries_by_claim_id = build_claims_to_queries_index(queries)
+    claims_by_doc_id: dict[str, list[ClaimRow]] = defaultdict(list)
+    # Claim IDs are only unique within a document; keep the first row for duplicates.
+    claims_by_doc_and_id: dict[tuple[str, str], ClaimRow] = {}
+    for claim in claims:
+        claims_by_doc_id[claim.doc_id].append(claim)
+        claims_by_doc_and_id.setdefault((claim.doc_id, claim.claim_id), claim)
+
+    return EpisodeBrowserIndex(
+        queries_by_claim_id=queries_by_claim_id,
+        claims_by_doc_and_id=claims_by_doc_and_id,
+        segment_to_claims=build_segment_to_claims_index(claims),
+        source_groups=source_groups,
+        episodes_by_doc_id=episodes_by_doc_id,
+        segment_ids_by_doc_id={
+            doc_id: frozenset(segment.seg_id for segment in document.segments)
+            for doc_id, document in transcripts_by_doc_id.items()
+        },
+        segment_search_texts={
+            doc_id: tuple(segment.text.casefold() for segment in document.segments)
+            for doc_id, document in transcripts_by_doc_id.items()
+        },
+        segment_markup={
+            doc_id: build_segment_markup(document)
+            for doc_id, document in transcripts_by_doc_id.items()
+        },
+        episode_rows_by_doc_id={
+            doc_id: build_episode_claim_rows(
+                doc_id,
+                claims_by_doc_id.get(doc_id, []),
+                queries_by_claim_id,
+            )
+            for doc_id in transcripts_by_doc_id
+        },
+        source_summaries={
+            group.source_key: build_source_summary(
+                group.episode_doc_ids,
+                [
+                    claim
+                    for doc_id in group.episode_doc_ids
+                    for claim in claims_by_doc_id.get(doc_id, [])
+                ],
+                queries_by_claim_id,
+            )
+            for group in source_groups
+        },
+    )
+
+
+def find_matching_segment_ids(
+    document: TranscriptDocument,
+    segment_search_texts: tuple[str, ...],
+    search_text: str,
+) -> frozenset[str]:
+    """Return seg_ids whose text contains the search text.
+
+    `segment_search_texts` holds the case-folded segment texts in document order.
+    """
+    normalized_search = normalize_search_text(search_text)
+    if not normalized_search:
+        return frozenset()
+    return frozenset(
+        segment.seg_id
+        for segment, folded_text in zip(document.segments, segment_search_texts)
+        if normalized_search in folded_text
+    )
+
+
+def _sorted_options(values: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted({value for value in values if value}))
+
+
+def build_debug_tabs_index(
+    claims: list[ClaimRow],
+    queries: list[QueryRow],
+) -> DebugTabsIndex:
+    """Build the Debug Mode lookups and filter option lists, with claims sorted by claim_id."""
+    sorted_claims = sorted(claims, key=lambda row: row.claim_id)
+    claims_by_doc_id: dict[str, list[ClaimRow]] = defaultdict(list)
+    for claim in sorted_claims:
+        claims_by_doc_id[claim.doc_id].append(claim)
+    # Queries carry only a claim_id; resolve them like compute_link_diagnostics does,
+    # so a query is orphaned here exactly when Diagnostics reports it.
+    claims_by_id = index_claims_by_id(claims)
+    linked_queries: list[LinkedQuery] = []
+    for query in queries:
+        linked_claim = claims_by_id.get(query.claim_id)
+        search_blob = query.search_blob
+        if linked_claim is not None:
+            search_blob = f"{search_blob} {linked_claim.claim_text_search}"
+        linked_queries.append(LinkedQuery(query, linked_claim, search_blob))
+    return DebugTabsIndex(
+        claims=sorted_claims,
+        claims_by_doc_id=dict(claims_by_doc_id),
+        queries_by_claim_id=build_claims_to_queries_index(queries),
+        linked_queries=linked_queries,
+        doc_ids=_sorted_options(claim.doc_id for claim in claims),
+        speakers=_sorted_options(claim.speaker for claim in claims),
+        claim_types=_sorted_options(claim.claim_type for claim in claims),
+        models=_sorted_options(claim.model for claim in claims),
+        preferred_sources=_sorted_options(
+            source for query in queries for source in query.preferred_sources
+        ),
+        claim_labels={
+            (claim.doc_id, claim.claim_id): claim_option_label(claim) for claim in claims
+        },
+    )
+
+
+def _claim_issue_columns(rows: list[ClaimRow]) -> dict[str, list[str]]:
+    return {
+        "claim_id": [row.claim_id for row in rows],
+        "doc_id": [row.doc_id for row in rows],
+        "claim_text": [row.claim_text for row in rows],
+    }
+
+
+def build_diagnostics_tables(diagnostics: LinkDiagnostics) -> DiagnosticsTables:
+    """Flatten each diagnostics section into the columns shown by `st.dataframe`."""
+    missing_links = diagnostics.missing_evidence_links
+    return DiagnosticsTables(
+        orphan_queries={
+            "claim_id": [row.claim_id for row in diagnostics.orphan_queries],
+            "query": [row.query for row in diagnostics.orphan_queries],
+        },
+        claims_without_queries=_claim_issue_columns(diagnostics.claims_without_queries),
+        claims_missing_transcript_doc=_claim_issue_columns(diagnostics.claims_missing_transcript_doc),
+        claims_without_evidence=_claim_issue_columns(diagnostics.claims_without_evidence),
+        missing_evidence_links={
+            "claim_id": [row.claim_id for row in missing_links],
+            "doc_id": [row.doc_id for row in missing_links],
+            "seg_id": [row.seg_id for row in missing_links],
+            "quote": [row.quote for row in missing_links],
+        },
+    )
+
+
+def _episode_claim_search_text(claim: ClaimRow) -> tuple[str, tuple[tuple[int, int], ...]]:
+    # Fold each field before joining, so offsets stay exact when case folding changes length.
+    folded_id, folded_speaker, folded_type, folded_text = (
+        value.casefold()
+        for value in (claim.claim_id, claim.speaker, claim.claim_type, claim.claim_text)
+    )
+    speaker_start = len(folded_id) + 1
+    speaker_end = speaker_start + len(folded_speaker)
+    text_start = speaker_end + 1 + len(folded_type) + 1
+    search_blob = " ".join([folded_id, folded_speaker, folded_type, folded_text])
+    spans = (
+        (0, len(folded_id)),
+        (speaker_start, speaker_end),
+        (text_start, len(search_blob)),
+    )
+    return search_blob, spans
+
+
 def build_episode_claim_rows(
     doc_id: str,
     claims: list[ClaimRow],
@@ -190,6 +467,7 @@ def build_episode_claim_rows(
     rows: list[EpisodeClaimRow] = []
     for claim in episode_claims:
         first_seg_id = claim.evidence[0].seg_id if claim.evidence else ""
+        search_blob, picker_spans = _episode_claim_search_text(claim)
         rows.append(
             EpisodeClaimRow(
                 claim_id=claim.claim_id,
@@ -200,11 +478,22 @@ def build_episode_claim_rows(
                 boldness_rating=claim.boldness_rating,
                 query_count=len(queries_by_claim_id.get(claim.claim_id, [])),
                 first_seg_id=first_seg_id,
+                search_blob=search_blob,
+                picker_spans=picker_spans,
             )
         )
     return rows
 
 
+def episode_claim_matches_picker(row: EpisodeClaimRow, search_text: str) -> bool:
+    """Return whether the "Find claim" picker search matches the row's id, speaker or text.
+
+    `search_text` must already be normalized with `normalize_search_text`.
+    """
+    # Bounded find() checks each field without slicing copies out of search_blob.
+    return any(row.search_blob.find(search_text, start, end) != -1 for start, end in row.picker_spans)
+
+
 def filter_episode_claim_rows(
     rows: list[EpisodeClaimRow],
     *,
@@ -214,21 +503,19 @@ def filter_episode_claim_rows(
     search_text: str,
 ) -> list[EpisodeClaimRow]:
     """Filter episode claim rows based on browser controls."""
-    normalized_search = search_text.strip().lower()
+    normalized_search = normalize_search_text(search_text)
+    speaker_set = frozenset(selected_speakers)
+    claim_type_set = frozenset(selected_claim_types)
     filtered: list[EpisodeClaimRow] = []
     for row in rows:
-        if selected_speakers and row.speaker not in selected_speakers:
+        if speaker_set and row.speaker not in speaker_set:
             continue
-        if selected_claim_types and row.claim_type not in selected_claim_types:
+        if claim_type_set and row.claim_type not in claim_type_set:
             continue
         if only_with_queries and row.query_count == 0:
             continue
-        if normalized_search:
-            haystack = " ".join(
-                [row.claim_id, row.speaker, row.claim_type, row.claim_text]
-            ).lower()
-            if normalized_search not in haystack:
-                continue
+        if normalized_search and normalized_search not in row.search_blob:
+            continue
         filtered.append(row)
     return filtered
 
@@ -237,11 +524,7 @@ def default_claim_for_segment(claims: list[ClaimRow]) -> ClaimRow | None:
     """Choose a deterministic default claim for a selected segment."""
     if not claims:
         return None
-    ranked = sorted(
-        claims,
-        key=lambda row: (-(row.boldness_rating or 0), row.claim_id),
-    )
-    return ranked[0]
+    return min(claims, key=lambda row: (-(row.boldness_rating or 0), row.claim_id))
 
 
 def build_source_summary(
@@ -255,8 +538,12 @@ def build_source_summary(
     query_count = sum(len(queries_by_claim_id.get(row.claim_id, [])) for row in source_claims)
 
     speaker_counts = Counter(row.speaker for row in source_claims if row.speaker)
-    ranked_speakers = sorted(speaker_counts.items(), key=lambda row: (-row[1], row[0].lower()))
-    top_speakers = tuple(name for name, _ in ranked_speakers[:3])
+    ranked_speakers = heapq.nsmallest(
+        3,
+        speaker_counts.items(),
+        key=lambda row: (-row[1], row[0].lower()),
+    )
+    top_speakers = tuple(name for name, _ in ranked_speakers)
 
     return SourceSummary(
         episode_count=len(source_doc_ids),
@@ -266,61 +553,93 @@ def build_source_summary(
     )
 
 
+@lru_cache(maxsize=PREVIEW_CACHE_SIZE)
 def truncate_preview(text: str, limit: int = PREVIEW_LIMIT) -> str:
     if len(text) <= limit:
         return text
-    return f"{text[: limit - 3].rstrip()}..."
+    return text[: limit - len(PREVIEW_ELLIPSIS)].rstrip() + PREVIEW_ELLIPSIS
 
 
-def claim_matches_filters(
-    claim: ClaimRow,
+def make_claim_filter(
+    *,
+    selected_speakers: frozenset[str],
+    selected_claim_types: frozenset[str],
+    selected_models: frozenset[str],
+    search_text: str,
+) -> Callable[[ClaimRow], bool]:
+    """Bind claims-table field filter state once and return a per-row predicate.
+
+    `search_text` must already be normalized with `normalize_search_text`.
+    """
+
+    def predicate(claim: ClaimRow) -> bool:
+        if selected_speakers and claim.speaker not in selected_speakers:
+            return False
+        if selected_claim_types and claim.claim_type not in selected_claim_types:
+            return False
+        if selected_models and claim.model not in selected_models:
+            return False
+        return not search_text or search_text in claim.search_blob
+
+    return predicate
+
+
+def filter_claim_rows(
+    debug_index: DebugTabsIndex,
     *,
     selected_doc: str,
-    selected_speakers: list[str],
-    selected_claim_types: list[str],
-    selected_models: list[str],
+    selected_speakers: frozenset[str],
+    selected_claim_types: frozenset[str],
+    selected_models: frozenset[str],
     only_with_queries: bool,
-    queries_by_claim_id: dict[str, list[QueryRow]],
     search_text: str,
-) -> bool:
-    if selected_doc != "All" and claim.doc_id != selected_doc:
-        return False
-    if selected_speakers and claim.speaker not in selected_speakers:
-        return False
-    if selected_claim_types and claim.claim_type not in selected_claim_types:
-        return False
-    if selected_models and claim.model not in selected_models:
-        return False
-    if only_with_queries and claim.claim_id not in queries_by_claim_id:
-        return False
-    if not search_text:
-        return True
-
-    haystack = " ".join(
-        [claim.claim_id, claim.doc_id, claim.speaker, claim.claim_type, claim.claim_text]
-    ).lower()
-    return search_text in haystack
+) -> list[ClaimRow]:
+    """Filter claims-table rows, skipping per-row checks for inactive filters.
+
+    `search_text` must already be normalized with `normalize_search_text`.
+    """
+    pool = debug_index.claims
+    if selected_doc != "All":
+        # The per-document slice already applies the document filter.
+        pool = debug_index.claims_by_doc_id.get(selected_doc, [])
+    if only_with_queries:
+        # Usually the most selective check, so narrow the pool before the other filters.
+        queries_by_claim_id = debug_index.queries_by_claim_id
+        pool = [claim for claim in pool if claim.claim_id in queries_by_claim_id]
+
+    if not (selected_speakers or selected_claim_types or selected_models):
+        if not search_text:
+            return list(pool)
+        return [claim for claim in pool if search_text in claim.search_blob]
+    predicate = make_claim_filter(
+        selected_speakers=selected_speakers,
+        selected_claim_types=selected_claim_types,
+        selected_models=selected_models,
+        search_text=search_text,
+    )
+    return [claim for claim in pool if predicate(claim)]
 
 
 def query_matches_filters(
-    query: QueryRow,
+    linked_query: LinkedQuery,
     *,
-    linked_claim: ClaimRow | None,
-    selected_claim_types: list[str],
+    selected_claim_types: frozenset[str],
     selected_source_set: set[str],
     only_orphans: bool,
     search_text: str,
 ) -> bool:
+    """Return whether a query passes the queries-table filters.
+
+    `search_text` must already be normalized with `normalize_search_text`.
+    """
+    linked_claim = linked_query.linked_claim
     if only_orphans and linked_claim is not None:
         return False
     if selected_claim_types:
         if linked_claim is None or linked_claim.claim_type not in selected_claim_types:
             return False
-    if selected_source_set and not selected_source_set.intersection(query.preferred_sources):
+    if selected_source_set and not any(
+        source in selected_source_set for source in linked_query.query.preferred_sources
+    ):
         return False
-    if not search_text:
-        return True
-
-    claim_text = linked_claim.claim_text if linked_claim else ""
-    haystack = " ".join([query.query, query.why_this_query, claim_text]).lower()
-    return search_text in haystack
+    return not search_text or search_text in linked_query.search_blob
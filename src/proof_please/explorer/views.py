@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import html
-from collections import defaultdict
 
 import streamlit as st
 import streamlit.components.v1 as components
@@ -11,27 +10,34 @@ import streamlit.components.v1 as components
 from proof_please.explorer.data_access import ExplorerDataset
 from proof_please.explorer.linking import (
     LinkDiagnostics,
-    group_queries_by_claim_id,
-    index_claims_by_id,
     resolve_claim_evidence,
 )
 from proof_please.explorer.models import ClaimRow, QueryRow
 from proof_please.explorer.view_logic import (
+    DebugTabsIndex,
+    DiagnosticsTables,
+    EpisodeBrowserIndex,
     EpisodeClaimRow,
+    SegmentMarkup,
     SourceGroup,
-    claim_matches_filters,
-    build_claims_to_queries_index,
-    build_episode_claim_rows,
-    build_segment_to_claims_index,
-    build_source_episode_index,
-    build_source_summary,
+    episode_claim_matches_picker,
     episode_option_label,
+    filter_claim_rows,
     filter_episode_claim_rows,
+    find_matching_segment_ids,
+    format_timestamp,
+    normalize_search_text,
     query_matches_filters,
     truncate_preview,
 )
 from proof_please.pipeline.models import TranscriptDocument
 
+# Above this many linked queries, the claims tab renders them as one HTML block
+# instead of one expander widget per query.
+QUERY_EXPANDER_LIMIT = 8
+# Diagnostics issue tables send this many rows to the frontend per "Show more" step.
+ISSUE_BATCH_SIZE = 100
+
 
 def _render_text_card(text: str) -> None:
     st.markdown(
@@ -44,26 +50,11 @@ def _render_text_card(text: str) -> None:
     )
 
 
-def _claim_label(claim: ClaimRow) -> str:
-    preview = truncate_preview(claim.claim_text)
-    speaker = claim.speaker or "Unknown speaker"
-    return f"{claim.claim_id} | {speaker} | {preview}"
-
-
 def _query_label(query: QueryRow) -> str:
     preview = truncate_preview(query.query)
     return f"{query.claim_id} | {preview}"
 
 
-def _format_timestamp(seconds: int) -> str:
-    total_seconds = max(int(seconds), 0)
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
-    if hours:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
-
-
 def _sync_select_state(key: str, options: list[str]) -> None:
     if not options:
         st.session_state.pop(key, None)
@@ -77,9 +68,10 @@ def _sanitize_multiselect_state(key: str, options: list[str]) -> None:
     if not isinstance(selected, list):
         st.session_state[key] = []
         return
-    sanitized = [value for value in selected if value in options]
-    if sanitized != selected:
-        st.session_state[key] = sanitized
+    option_set = set(options)
+    if option_set.issuperset(selected):
+        return
+    st.session_state[key] = [value for value in selected if value in option_set]
 
 
 def _source_group_label(group: SourceGroup) -> str:
@@ -88,27 +80,35 @@ def _source_group_label(group: SourceGroup) -> str:
 
 
 def _set_claim_debug_state(claim: ClaimRow) -> None:
-    st.session_state["pp_mode"] = "Debug Mode"
-    st.session_state["pp_debug_section"] = "Claims"
-    st.session_state["claims_doc_filter"] = claim.doc_id
-    st.session_state["claims_search"] = ""
-    st.session_state["claims_speaker_filter"] = []
-    st.session_state["claims_type_filter"] = []
-    st.session_state["claims_model_filter"] = []
-    st.session_state["claims_with_queries_filter"] = False
-    st.session_state["claims_selected_claim"] = claim.claim_id
-    st.session_state["claims_focus_claim_id"] = claim.claim_id
+    st.session_state.update(
+        {
+            "pp_mode": "Debug Mode",
+            "pp_debug_section": "Claims",
+            "claims_doc_filter": claim.doc_id,
+            "claims_search": "",
+            "claims_speaker_filter": [],
+            "claims_type_filter": [],
+            "claims_model_filter": [],
+            "claims_with_queries_filter": False,
+            "claims_selected_claim": claim.claim_id,
+            "claims_focus_claim_id": claim.claim_id,
+        }
+    )
 
 
 def _set_query_debug_state(claim: ClaimRow) -> None:
-    st.session_state["pp_mode"] = "Debug Mode"
-    st.session_state["pp_debug_section"] = "Queries"
-    st.session_state["queries_focus_claim_id"] = claim.claim_id
-    st.session_state["queries_search"] = ""
-    st.session_state["queries_source_filter"] = []
-    st.session_state["queries_claim_type_filter"] = []
-    st.session_state["queries_orphan_filter"] = False
-    st.session_state["queries_selected_query"] = 0
+    st.session_state.update(
+        {
+            "pp_mode": "Debug Mode",
+            "pp_debug_section": "Queries",
+            "queries_focus_claim_id": claim.claim_id,
+            "queries_search": "",
+            "queries_source_filter": [],
+            "queries_claim_type_filter": [],
+            "queries_orphan_filter": False,
+            "queries_selected_query": 0,
+        }
+    )
 
 
 def render_source_summary(
@@ -185,36 +185,52 @@ def _render_scroll_to_segment(seg_id: str) -> None:
     components.html(script, height=0, width=0)
 
 
+def _segment_html(markup: SegmentMarkup, classes: str) -> str:
+    return (
+        f"<article class='{classes}' data-segid='{markup.seg_id}'>"
+        "<div class='segment-row-meta'>"
+        f"<span class='segment-seg-id'>{markup.seg_id}</span>"
+        f"<span>{markup.timestamp}</span>"
+        f"<span>{markup.speaker}</span>"
+        "</div>"
+        f"<p class='segment-row-text'>{markup.text}</p>"
+        "</article>"
+    )
+
+
 def render_transcript_with_highlights(
     document: TranscriptDocument,
+    segment_markup: tuple[SegmentMarkup, ...],
     *,
     highlighted_claim_counts: dict[str, int],
     active_seg_id: str,
-    search_text: str,
+    matching_seg_ids: frozenset[str],
 ) -> str:
-    """Render transcript and return newly selected segment id, if any."""
-    normalized_search = search_text.strip().lower()
+    """Render transcript and return newly selected segment id, if any.
+
+    Runs of plain segments are emitted as one markdown element; only highlighted
+    segments, which need their own buttons, break a run.
+    """
     selected_segment_id = ""
+    pending_html: list[str] = []
     transcript_container = st.container(height=760)
     with transcript_container:
-        for segment in document.segments:
+        for segment, markup in zip(document.segments, segment_markup):
             claim_count = highlighted_claim_counts.get(segment.seg_id, 0)
             if claim_count > 0:
                 suffix = "claim" if claim_count == 1 else "claims"
                 is_active = segment.seg_id == active_seg_id and bool(active_seg_id)
                 active_suffix = "  [selected]" if is_active else ""
                 segment_button_label = (
-                    f"{segment.seg_id}  {_format_timestamp(segment.start_time_s)}  "
+                    f"{segment.seg_id}  {format_timestamp(segment.start_time_s)}  "
                     f"{segment.speaker or 'Unknown speaker'}  {claim_count} {suffix}{active_suffix}\n"
                     f"{segment.text}"
                 )
-                st.markdown(
-                    (
-                        f"<div class='segment-pick-anchor' "
-                        f"data-segid='{html.escape(segment.seg_id, quote=True)}'></div>"
-                    ),
-                    unsafe_allow_html=True,
+                pending_html.append(
+                    f"<div class='segment-pick-anchor' data-segid='{markup.seg_id}'></div>"
                 )
+                st.markdown("".join(pending_html), unsafe_allow_html=True)
+                pending_html.clear()
                 if st.button(
                     segment_button_label,
                     key=f"episode_pick_segment_{document.doc_id}_{segment.seg_id}",
@@ -227,25 +243,17 @@ def render_transcript_with_highlights(
             classes = ["segment-row"]
             if segment.seg_id == active_seg_id and active_seg_id:
                 classes.append("segment-row--active")
-            if normalized_search and normalized_search in segment.text.lower():
+            if segment.seg_id in matching_seg_ids:
                 classes.append("segment-row--match")
+            pending_html.append(_segment_html(markup, " ".join(classes)))
 
-            segment_html = (
-                f"<article class='{' '.join(classes)}' data-segid='{html.escape(segment.seg_id)}'>"
-                "<div class='segment-row-meta'>"
-                f"<span class='segment-seg-id'>{html.escape(segment.seg_id)}</span>"
-                f"<span>{_format_timestamp(segment.start_time_s)}</span>"
-                f"<span>{html.escape(segment.speaker or 'Unknown speaker')}</span>"
-                "</div>"
-                f"<p class='segment-row-text'>{html.escape(segment.text)}</p>"
-                "</article>"
-            )
-            st.markdown(segment_html, unsafe_allow_html=True)
+        if pending_html:
+            st.markdown("".join(pending_html), unsafe_allow_html=True)
 
     return selected_segment_id
 
 
-def render_episode_browser(dataset: ExplorerDataset) -> None:
+def render_episode_browser(dataset: ExplorerDataset, browser_index: EpisodeBrowserIndex) -> None:
     """Render source/episode-first transcript browsing workflow."""
     st.markdown("## Episode Browser")
     st.caption(
@@ -256,13 +264,10 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
         st.info("No transcript documents loaded. Add transcript JSON files to browse episodes.")
         return
 
-    queries_by_claim_id = build_claims_to_queries_index(dataset.queries)
-    segment_to_claims = build_segment_to_claims_index(dataset.claims)
-    source_groups, episodes_by_doc_id = build_source_episode_index(
-        dataset.transcripts_by_doc_id,
-        dataset.claims,
-        dataset.queries,
-    )
+    queries_by_claim_id = browser_index.queries_by_claim_id
+    segment_to_claims = browser_index.segment_to_claims
+    source_groups = browser_index.source_groups
+    episodes_by_doc_id = browser_index.episodes_by_doc_id
     if not source_groups:
         st.info("No source groups available for the currently loaded transcripts.")
         return
@@ -301,11 +306,7 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
         st.session_state["episode_active_seg_id"] = ""
         st.session_state["episode_active_claim_id"] = None
 
-    episode_rows = build_episode_claim_rows(
-        selected_doc_id,
-        dataset.claims,
-        queries_by_claim_id,
-    )
+    episode_rows = browser_index.episode_rows_by_doc_id[selected_doc_id]
     speaker_options = sorted({row.speaker for row in episode_rows if row.speaker})
     claim_type_options = sorted({row.claim_type for row in episode_rows if row.claim_type})
     _sanitize_multiselect_state("episode_speaker_filter", speaker_options)
@@ -344,11 +345,7 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
             placeholder="search transcript text...",
         )
     with summary_col:
-        source_summary = build_source_summary(
-            selected_source.episode_doc_ids,
-            dataset.claims,
-            queries_by_claim_id,
-        )
+        source_summary = browser_index.source_summaries[selected_source.source_key]
         render_source_summary(
             selected_source,
             summary_claim_count=source_summary.claim_count,
@@ -365,26 +362,22 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
     )
     st.caption(f"{len(filtered_rows)} filtered claim(s) in the selected episode.")
 
-    claim_lookup = {
-        claim.claim_id: claim
-        for claim in dataset.claims
-        if claim.doc_id == selected_doc_id
-    }
     filtered_claim_id_set = {row.claim_id for row in filtered_rows}
 
-    segment_claims_for_doc: dict[str, list[ClaimRow]] = defaultdict(list)
-    for (doc_id, seg_id), claim_rows in segment_to_claims.items():
-        if doc_id != selected_doc_id:
-            continue
-        segment_claims_for_doc[seg_id] = [
-            row for row in claim_rows if row.claim_id in filtered_claim_id_set
-        ]
+    segment_claims_for_doc = {
+        seg_id: [row for row in claim_rows if row.claim_id in filtered_claim_id_set]
+        for seg_id, claim_rows in segment_to_claims.get(selected_doc_id, {}).items()
+    }
+    highlighted_claim_counts = {
+        seg_id: claim_count
+        for seg_id, claim_rows in segment_claims_for_doc.items()
+        if (claim_count := len(claim_rows))
+    }
 
-    segment_lookup = {segment.seg_id: segment for segment in selected_document.segments}
-    segment_ids = list(segment_lookup.keys())
+    segment_ids = browser_index.segment_ids_by_doc_id[selected_doc_id]
     if "episode_active_seg_id" not in st.session_state:
         st.session_state["episode_active_seg_id"] = ""
-    if st.session_state["episode_active_seg_id"] not in segment_lookup:
+    if st.session_state["episode_active_seg_id"] not in segment_ids:
         st.session_state["episode_active_seg_id"] = ""
     if "episode_active_claim_id" not in st.session_state:
         st.session_state["episode_active_claim_id"] = None
@@ -400,15 +393,19 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
         else:
             picked_seg_id = render_transcript_with_highlights(
                 selected_document,
-                highlighted_claim_counts={
-                    seg_id: len(claim_rows)
-                    for seg_id, claim_rows in segment_claims_for_doc.items()
-                    if claim_rows
-                },
+                browser_index.segment_markup[selected_doc_id],
+                highlighted_claim_counts=highlighted_claim_counts,
                 active_seg_id=st.session_state["episode_active_seg_id"],
-                search_text=transcript_search_text,
+                matching_seg_ids=find_matching_segment_ids(
+                    selected_document,
+                    browser_index.segment_search_texts[selected_doc_id],
+                    transcript_search_text,
+                ),
             )
-            if picked_seg_id:
+            if picked_seg_id and (
+                picked_seg_id != st.session_state["episode_active_seg_id"]
+                or st.session_state["episode_active_claim_id"] is not None
+            ):
                 st.session_state["episode_active_seg_id"] = picked_seg_id
                 st.session_state["episode_active_claim_id"] = None
                 st.rerun()
@@ -416,14 +413,11 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
     with right_pane:
         st.markdown("### Claims")
         active_seg_id = st.session_state["episode_active_seg_id"]
+        segment_claim_ids = {
+            claim.claim_id for claim in segment_claims_for_doc.get(active_seg_id, [])
+        }
         linked_rows_for_segment = sorted(
-            [
-                row
-                for row in filtered_rows
-                if row.claim_id in {
-                    claim.claim_id for claim in segment_claims_for_doc.get(active_seg_id, [])
-                }
-            ],
+            [row for row in filtered_rows if row.claim_id in segment_claim_ids],
             key=lambda row: (-(row.boldness_rating or 0), row.claim_id),
         )
 
@@ -466,26 +460,30 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
                     width="stretch",
                     type="primary",
                 ):
+                    # Panes above this point were drawn from the old state; rerun only if it moved.
+                    state_changed = st.session_state["episode_active_claim_id"] != row.claim_id
                     st.session_state["episode_active_claim_id"] = row.claim_id
                     if row.first_seg_id:
+                        state_changed = (
+                            state_changed
+                            or st.session_state["episode_active_seg_id"] != row.first_seg_id
+                        )
                         st.session_state["episode_active_seg_id"] = row.first_seg_id
                         st.session_state["episode_scroll_target_seg_id"] = row.first_seg_id
-                    st.rerun()
-
-        claim_picker_search = st.text_input(
-            "Find claim",
-            key="episode_claim_picker_search",
-            placeholder="search claim id, speaker, text...",
-        ).strip().lower()
+                    if state_changed:
+                        st.rerun()
+
+        claim_picker_search = normalize_search_text(
+            st.text_input(
+                "Find claim",
+                key="episode_claim_picker_search",
+                placeholder="search claim id, speaker, text...",
+            )
+        )
         picker_ids = [
             row.claim_id
             for row in claim_context_rows
-            if (
-                not claim_picker_search
-                or claim_picker_search in row.claim_id.lower()
-                or claim_picker_search in (row.speaker or "").lower()
-                or claim_picker_search in row.claim_text.lower()
-            )
+            if not claim_picker_search or episode_claim_matches_picker(row, claim_picker_search)
         ]
         if not picker_ids:
             st.caption("No matches for claim search; showing full list.")
@@ -510,7 +508,7 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
             st.session_state["episode_scroll_target_seg_id"] = target_seg_id
             st.rerun()
 
-        selected_claim = claim_lookup.get(selected_claim_id)
+        selected_claim = browser_index.claims_by_doc_and_id.get((selected_doc_id, selected_claim_id))
         if selected_claim is None:
             st.error("Selected claim is no longer available in the current episode context.")
             return
@@ -539,23 +537,25 @@ def render_episode_browser(dataset: ExplorerDataset) -> None:
 
         debug_col1, debug_col2 = st.columns(2)
         with debug_col1:
-            if st.button(
+            # Callbacks run before the next rerun draws any widget, so the mode switch
+            # lands in that single rerun without a second st.rerun().
+            st.button(
                 "Open Claims debug",
                 key=f"open_claim_debug_{selected_claim.claim_id}",
                 width="stretch",
                 type="primary",
-            ):
-                _set_claim_debug_state(selected_claim)
-                st.rerun()
+                on_click=_set_claim_debug_state,
+                args=(selected_claim,),
+            )
         with debug_col2:
-            if st.button(
+            st.button(
                 "Open Queries debug",
                 key=f"open_query_debug_{selected_claim.claim_id}",
                 width="stretch",
                 type="primary",
-            ):
-                _set_query_debug_state(selected_claim)
-                st.rerun()
+                on_click=_set_query_debug_state,
+                args=(selected_claim,),
+            )
 
     scroll_target = st.session_state.pop("episode_scroll_target_seg_id", "")
     if scroll_target:
@@ -583,9 +583,9 @@ def _render_claim_card(claim: ClaimRow) -> None:
     time_start = claim.time_range_s.get("start")
     time_end = claim.time_range_s.get("end")
     if time_start is not None and time_end is not None:
-        time_text = f"{_format_timestamp(time_start)}-{_format_timestamp(time_end)}"
+        time_text = f"{format_timestamp(time_start)}-{format_timestamp(time_end)}"
     elif time_start is not None:
-        time_text = _format_timestamp(time_start)
+        time_text = format_timestamp(time_start)
     else:
         time_text = "unknown"
 
@@ -640,73 +640,130 @@ def _render_claim_evidence(claim: ClaimRow, dataset: ExplorerDataset, expander_p
                 )
 
 
-def render_claims_tab(dataset: ExplorerDataset) -> None:
+def _filter_claims_memoized(
+    debug_index: DebugTabsIndex,
+    *,
+    selected_doc: str,
+    selected_speakers: frozenset[str],
+    selected_claim_types: frozenset[str],
+    selected_models: frozenset[str],
+    only_with_queries: bool,
+    search_text: str,
+) -> list[ClaimRow]:
+    """Reuse the previous rerun's filtered claims while the index and filters are unchanged."""
+    filter_state = (
+        selected_doc,
+        selected_speakers,
+        selected_claim_types,
+        selected_models,
+        only_with_queries,
+        search_text,
+    )
+    memo = st.session_state.get("claims_filter_memo")
+    if memo is not None and memo[0] is debug_index and memo[1] == filter_state:
+        return memo[2]
+
+    filtered_claims = filter_claim_rows(
+        debug_index,
+        selected_doc=selected_doc,
+        selected_speakers=selected_speakers,
+        selected_claim_types=selected_claim_types,
+        selected_models=selected_models,
+        only_with_queries=only_with_queries,
+        search_text=search_text,
+    )
+    st.session_state["claims_filter_memo"] = (debug_index, filter_state, filtered_claims)
+    return filtered_claims
+
+
+def _query_details_html(index: int, query: QueryRow) -> str:
+    parts = [
+        "<details class='query-card'>",
+        f"<summary>Query {index}: {html.escape(query.query)}</summary>",
+        f"<p class='query-card-note'>Claim ID: <code>{html.escape(query.claim_id)}</code></p>",
+    ]
+    if query.why_this_query:
+        parts.append(f"<p class='query-card-text'>{html.escape(query.why_this_query)}</p>")
+    if query.preferred_sources:
+        sources = html.escape(", ".join(query.preferred_sources))
+        parts.append(f"<p class='query-card-note'>Preferred sources: {sources}</p>")
+    parts.append("</details>")
+    return "".join(parts)
+
+
+def render_claims_tab(dataset: ExplorerDataset, debug_index: DebugTabsIndex) -> None:
     """Render claims-first workflow with transcript and query linkage."""
     st.subheader("Claims -> Transcript -> Queries")
-    claims = sorted(dataset.claims, key=lambda row: row.claim_id)
-    queries_by_claim_id = group_queries_by_claim_id(dataset.queries)
+    claims = debug_index.claims
+    queries_by_claim_id = debug_index.queries_by_claim_id
 
     if not claims:
         st.info("No claims loaded. Check your claims JSONL path.")
         return
 
-    docs = sorted({claim.doc_id for claim in claims})
-    speakers = sorted({claim.speaker for claim in claims if claim.speaker})
-    claim_types = sorted({claim.claim_type for claim in claims if claim.claim_type})
-    models = sorted({claim.model for claim in claims if claim.model})
-
     with st.container():
         col1, col2, col3, col4 = st.columns(4)
         search_text = col1.text_input("Search claims", key="claims_search")
-        selected_doc = col2.selectbox("Document", options=["All", *docs], key="claims_doc_filter")
-        selected_speakers = col3.multiselect("Speakers", options=speakers, key="claims_speaker_filter")
+        selected_doc = col2.selectbox(
+            "Document",
+            options=["All", *debug_index.doc_ids],
+            key="claims_doc_filter",
+        )
+        selected_speakers = col3.multiselect(
+            "Speakers",
+            options=debug_index.speakers,
+            key="claims_speaker_filter",
+        )
         selected_claim_types = col4.multiselect(
             "Claim types",
-            options=claim_types,
+            options=debug_index.claim_types,
             key="claims_type_filter",
         )
 
         col5, col6 = st.columns(2)
-        selected_models = col5.multiselect("Models", options=models, key="claims_model_filter")
+        selected_models = col5.multiselect(
+            "Models",
+            options=debug_index.models,
+            key="claims_model_filter",
+        )
         only_with_queries = col6.checkbox(
             "Only claims with linked queries",
             value=False,
             key="claims_with_queries_filter",
         )
 
-    search_text = search_text.strip().lower()
-    filtered_claims = [
-        claim
-        for claim in claims
-        if claim_matches_filters(
-            claim,
-            selected_doc=selected_doc,
-            selected_speakers=selected_speakers,
-            selected_claim_types=selected_claim_types,
-            selected_models=selected_models,
-            only_with_queries=only_with_queries,
-            queries_by_claim_id=queries_by_claim_id,
-            search_text=search_text,
-        )
-    ]
+    filtered_claims = _filter_claims_memoized(
+        debug_index,
+        selected_doc=selected_doc,
+        selected_speakers=frozenset(selected_speakers),
+        selected_claim_types=frozenset(selected_claim_types),
+        selected_models=frozenset(selected_models),
+        only_with_queries=only_with_queries,
+        search_text=normalize_search_text(search_text),
+    )
 
     st.caption(f"Showing {len(filtered_claims)} of {len(claims)} claims.")
     if not filtered_claims:
         st.info("No claims match the current filters.")
         return
 
-    claim_lookup = {claim.claim_id: claim for claim in filtered_claims}
+    # Claim IDs repeat across documents, so resolve the selection against the filtered rows.
+    claim_lookup: dict[str, ClaimRow] = {}
+    for claim in filtered_claims:
+        claim_lookup.setdefault(claim.claim_id, claim)
+    claim_ids = list(claim_lookup)
     focus_claim_id = st.session_state.pop("claims_focus_claim_id", "")
-    if focus_claim_id and focus_claim_id in claim_lookup:
+    if focus_claim_id and focus_claim_id in claim_ids:
         st.session_state["claims_selected_claim"] = focus_claim_id
-    claim_ids = list(claim_lookup.keys())
     if st.session_state.get("claims_selected_claim") not in claim_ids:
         st.session_state["claims_selected_claim"] = claim_ids[0]
 
     selected_claim_id = st.selectbox(
         "Select claim",
         options=claim_ids,
-        format_func=lambda claim_id: _claim_label(claim_lookup[claim_id]),
+        format_func=lambda claim_id: debug_index.claim_labels[
+            (claim_lookup[claim_id].doc_id, claim_id)
+        ],
         key="claims_selected_claim",
     )
     selected_claim = claim_lookup[selected_claim_id]
@@ -725,67 +782,59 @@ def render_claims_tab(dataset: ExplorerDataset) -> None:
         st.caption(f"{len(linked_queries)} linked queries")
         if not linked_queries:
             st.info("No query rows linked to this claim_id yet.")
-        for index, query in enumerate(linked_queries, start=1):
-            with st.expander(f"Query {index}: {query.query}"):
-                st.markdown(f"**Claim ID**: `{query.claim_id}`")
-                if query.why_this_query:
-                    st.write(query.why_this_query)
-                if query.preferred_sources:
-                    st.caption(
-                        "Preferred sources: "
-                        f"{', '.join(query.preferred_sources)}"
-                    )
-
-
-def render_queries_tab(dataset: ExplorerDataset) -> None:
+        elif len(linked_queries) > QUERY_EXPANDER_LIMIT:
+            st.markdown(
+                "".join(
+                    _query_details_html(index, query)
+                    for index, query in enumerate(linked_queries, start=1)
+                ),
+                unsafe_allow_html=True,
+            )
+        else:
+            for index, query in enumerate(linked_queries, start=1):
+                with st.expander(f"Query {index}: {query.query}"):
+                    st.markdown(f"**Claim ID**: `{query.claim_id}`")
+                    if query.why_this_query:
+                        st.write(query.why_this_query)
+                    if query.preferred_sources:
+                        st.caption(
+                            "Preferred sources: "
+                            f"{', '.join(query.preferred_sources)}"
+                        )
+
+
+def render_queries_tab(dataset: ExplorerDataset, debug_index: DebugTabsIndex) -> None:
     """Render query-first workflow with claim and transcript back-links."""
     st.subheader("Queries -> Claims -> Transcript evidence")
     queries = dataset.queries
-    claim_index = index_claims_by_id(dataset.claims)
     if not queries:
         st.info("No query rows loaded. Check your query JSONL path.")
         return
 
-    available_sources = sorted(
-        {
-            source
-            for query in queries
-            for source in query.preferred_sources
-            if source
-        }
-    )
-    claim_type_options = sorted(
-        {
-            claim.claim_type
-            for claim in claim_index.values()
-            if claim.claim_type
-        }
-    )
-
     with st.container():
         col1, col2, col3, col4 = st.columns(4)
         search_text = col1.text_input("Search queries", key="queries_search")
         selected_sources = col2.multiselect(
             "Preferred sources",
-            options=available_sources,
+            options=debug_index.preferred_sources,
             key="queries_source_filter",
         )
         selected_claim_types = col3.multiselect(
             "Linked claim type",
-            options=claim_type_options,
+            options=debug_index.claim_types,
             key="queries_claim_type_filter",
         )
         only_orphans = col4.checkbox("Only orphan queries", value=False, key="queries_orphan_filter")
 
     selected_source_set = set(selected_sources)
-    search_text = search_text.strip().lower()
+    selected_claim_type_set = frozenset(selected_claim_types)
+    search_text = normalize_search_text(search_text)
     filtered_queries = [
-        query
-        for query in queries
+        linked_query
+        for linked_query in debug_index.linked_queries
         if query_matches_filters(
-            query,
-            linked_claim=claim_index.get(query.claim_id),
-            selected_claim_types=selected_claim_types,
+            linked_query,
+            selected_claim_types=selected_claim_type_set,
             selected_source_set=selected_source_set,
             only_orphans=only_orphans,
             search_text=search_text,
@@ -794,7 +843,11 @@ def render_queries_tab(dataset: ExplorerDataset) -> None:
 
     focus_claim_id = st.session_state.pop("queries_focus_claim_id", "")
     if focus_claim_id:
-        focused_queries = [query for query in filtered_queries if query.claim_id == focus_claim_id]
+        focused_queries = [
+            linked_query
+            for linked_query in filtered_queries
+            if linked_query.query.claim_id == focus_claim_id
+        ]
         if focused_queries:
             filtered_queries = focused_queries
 
@@ -810,11 +863,11 @@ def render_queries_tab(dataset: ExplorerDataset) -> None:
     selected_query_index = st.selectbox(
         "Select query",
         options=query_indices,
-        format_func=lambda index: _query_label(filtered_queries[index]),
+        format_func=lambda index: _query_label(filtered_queries[index].query),
         key="queries_selected_query",
     )
-    selected_query = filtered_queries[selected_query_index]
-    linked_claim = claim_index.get(selected_query.claim_id)
+    selected_query = filtered_queries[selected_query_index].query
+    linked_claim = filtered_queries[selected_query_index].linked_claim
 
     left, right = st.columns([1.05, 1.2], gap="large")
     with left:
@@ -839,87 +892,98 @@ def render_queries_tab(dataset: ExplorerDataset) -> None:
             _render_claim_evidence(linked_claim, dataset, expander_prefix="Transcript evidence")
 
 
-def _render_issues(title: str, rows: list[dict[str, str]], empty_message: str) -> None:
-    with st.expander(title, expanded=False):
-        if not rows:
-            st.success(empty_message)
-            return
-        st.dataframe(rows, width="stretch")
+def reset_diagnostics_paging() -> None:
+    """Forget how many rows each Diagnostics issue table has expanded to."""
+    stale_keys = [
+        key
+        for key in st.session_state
+        if str(key).startswith("diagnostics_") and str(key).endswith("_shown")
+    ]
+    for key in stale_keys:
+        del st.session_state[key]
 
 
-def render_diagnostics_tab(dataset: ExplorerDataset, diagnostics: LinkDiagnostics) -> None:
-    """Render coverage and broken-link diagnostics for loaded data."""
-    st.subheader("Link diagnostics")
+def _show_more_issues(state_key: str) -> None:
+    st.session_state[state_key] = st.session_state.get(state_key, ISSUE_BATCH_SIZE) + ISSUE_BATCH_SIZE
 
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Orphan queries", len(diagnostics.orphan_queries))
-    col2.metric("Claims w/o queries", len(diagnostics.claims_without_queries))
-    col3.metric("Claims missing transcript", len(diagnostics.claims_missing_transcript_doc))
-    col4.metric("Missing evidence links", len(diagnostics.missing_evidence_links))
 
-    if dataset.warnings:
-        with st.expander("Load warnings", expanded=False):
-            for warning in dataset.warnings:
-                st.warning(warning)
+def _render_issues(key: str, title: str, columns: dict[str, list[str]], empty_message: str) -> None:
+    with st.expander(title, expanded=False):
+        row_count = max((len(values) for values in columns.values()), default=0)
+        if not row_count:
+            st.success(empty_message)
+            return
+        state_key = f"diagnostics_{key}_shown"
+        shown = st.session_state.get(state_key, ISSUE_BATCH_SIZE)
+        if row_count <= shown:
+            st.dataframe(columns, width="stretch")
+            return
+        st.dataframe({name: values[:shown] for name, values in columns.items()}, width="stretch")
+        st.caption(f"Showing {shown} of {row_count} rows.")
+        st.button(
+            "Show more",
+            key=f"diagnostics_{key}_show_more",
+            on_click=_show_more_issues,
+            args=(state_key,),
+        )
 
+
+@st.fragment
+def _render_issue_tables(tables: DiagnosticsTables) -> None:
+    # A fragment, so interactions inside the issue tables rerun only this block.
     _render_issues(
+        key="orphan_queries",
         title="Orphan queries",
-        rows=[
-            {"claim_id": row.claim_id, "query": row.query}
-            for row in diagnostics.orphan_queries
-        ],
+        columns=tables.orphan_queries,
         empty_message="Every query row resolves to a known claim.",
     )
 
     _render_issues(
+        key="claims_without_queries",
         title="Claims without generated queries",
-        rows=[
-            {
-                "claim_id": row.claim_id,
-                "doc_id": row.doc_id,
-                "claim_text": row.claim_text,
-            }
-            for row in diagnostics.claims_without_queries
-        ],
+        columns=tables.claims_without_queries,
         empty_message="Every claim has at least one linked query.",
     )
 
     _render_issues(
+        key="claims_missing_transcript_doc",
         title="Claims pointing to missing transcript docs",
-        rows=[
-            {
-                "claim_id": row.claim_id,
-                "doc_id": row.doc_id,
-                "claim_text": row.claim_text,
-            }
-            for row in diagnostics.claims_missing_transcript_doc
-        ],
+        columns=tables.claims_missing_transcript_doc,
         empty_message="Every claim doc_id is present in the transcript artifact set.",
     )
 
     _render_issues(
+        key="claims_without_evidence",
         title="Claims missing evidence rows",
-        rows=[
-            {
-                "claim_id": row.claim_id,
-                "doc_id": row.doc_id,
-                "claim_text": row.claim_text,
-            }
-            for row in diagnostics.claims_without_evidence
-        ],
+        columns=tables.claims_without_evidence,
         empty_message="Every claim has at least one evidence item.",
     )
 
     _render_issues(
+        key="missing_evidence_links",
         title="Evidence seg_ids not found in linked transcript",
-        rows=[
-            {
-                "claim_id": row.claim_id,
-                "doc_id": row.doc_id,
-                "seg_id": row.seg_id,
-                "quote": row.quote,
-            }
-            for row in diagnostics.missing_evidence_links
-        ],
+        columns=tables.missing_evidence_links,
         empty_message="Every evidence seg_id resolves to a transcript segment.",
     )
+
+
+def render_diagnostics_tab(
+    dataset: ExplorerDataset,
+    diagnostics: LinkDiagnostics,
+    tables: DiagnosticsTables,
+) -> None:
+    """Render coverage and broken-link diagnostics for loaded data."""
+    st.subheader("Link diagnostics")
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Orphan queries", len(diagnostics.orphan_queries))
+    col2.metric("Claims w/o queries", len(diagnostics.claims_without_queries))
+    col3.metric("Claims missing transcript", len(diagnostics.claims_missing_transcript_doc))
+    col4.metric("Missing evidence links", len(diagnostics.missing_evidence_links))
+
+    if dataset.warnings:
+        with st.expander("Load warnings", expanded=False):
+            for warning in dataset.warnings:
+                st.warning(warning)
+
+    _render_issue_tables(tables)
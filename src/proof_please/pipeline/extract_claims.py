@@ -3,17 +3,35 @@
 from __future__ import annotations
 
 import re
-import urllib.error
+import time
+import warnings
+from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from typing import Any
 
 from proof_please.core.io import extract_json_object
-from proof_please.core.model_client import chat_with_model
+from proof_please.core.model_client import CHAT_VARIANTS, ModelBackendError, chat_with_model
 from proof_please.pipeline.chunking import build_chunks
 from proof_please.pipeline.dedupe import dedupe_and_assign_claim_ids
+from proof_please.pipeline.llm_cache import (
+    CachedResponse,
+    build_cache_key,
+    get_cached_response,
+    put_cached_response,
+)
 from proof_please.pipeline.models import ModelBackendConfig
 from proof_please.pipeline.normalize import normalize_claims
 
+WHITESPACE_RE = re.compile(r"\s+")
+# Bump whenever build_prompt changes so cached responses from older prompts are not reused.
+PROMPT_VERSION = "v1"
+MAX_CONCURRENCY = 32
+PARSE_RETRIES = 2
+PARSE_RETRY_BACKOFF_S = 1.0
+
 
 def build_segment_block(segments: list[dict[str, Any]], max_segments: int) -> str:
     """Render transcript segments as compact lines for the LLM prompt."""
@@ -22,7 +40,7 @@ def build_segment_block(segments: list[dict[str, Any]], max_segments: int) -> st
         seg_id = str(segment.get("seg_id", "")).strip()
         speaker = str(segment.get("speaker", "")).strip()
         start = int(segment.get("start_time_s", 0))
-        text = re.sub(r"\s+", " ", str(segment.get("text", "")).strip())
+        text = WHITESPACE_RE.sub(" ", str(segment.get("text", "")).strip())
         if not seg_id or not text:
             continue
         lines.append(f"{seg_id} | {start} | {speaker} | {text}")
@@ -67,6 +85,78 @@ def build_prompt(doc_id: str, segment_block: str, chunk_label: str) -> list[dict
     ]
 
 
+class _UnparseableResponse(ValueError):
+    """Model response that contained no usable JSON object."""
+
+    def __init__(self, cause: ValueError, response_text: str) -> None:
+        super().__init__(str(cause))
+        self.response_text = response_text
+
+
+def _parse_response(response_text: str) -> CachedResponse | _UnparseableResponse:
+    try:
+        return CachedResponse(raw=response_text, parsed=extract_json_object(response_text))
+    except ValueError as exc:
+        return _UnparseableResponse(exc, response_text)
+
+
+def _parse_with_retries(
+    config: ModelBackendConfig,
+    model: str,
+    messages: list[dict[str, str]],
+    response_text: str,
+) -> CachedResponse | Exception:
+    # On unparseable output, show the model its reply and the parse error, then ask again.
+    response = _parse_response(response_text)
+    for attempt in range(1, PARSE_RETRIES + 1):
+        if not isinstance(response, _UnparseableResponse):
+            break
+        time.sleep(PARSE_RETRY_BACKOFF_S * attempt)
+        retry_messages = [
+            *messages,
+            {"role": "assistant", "content": response.response_text},
+            {"role": "user", "content": f"Your output had error: {response}. Return valid JSON only."},
+        ]
+        try:
+            response = _parse_response(chat_with_model(config=config, model=model, messages=retry_messages))
+        except Exception as exc:  # noqa: BLE001 - keep prototype error handling simple
+            return exc
+    return response
+
+
+def _call_model(
+    config: ModelBackendConfig,
+    model: str,
+    messages: list[dict[str, str]],
+    cache_dir: Path | None,
+) -> CachedResponse | Exception:
+    # Failures are returned, not raised, so each chunk reports its own error in order.
+    # Parsing happens here too, so cache hits reuse the stored payload without re-parsing.
+    key = (
+        build_cache_key(PROMPT_VERSION, config.base_url, model, messages, CHAT_VARIANTS)
+        if cache_dir
+        else ""
+    )
+    if cache_dir:
+        cached = get_cached_response(cache_dir, key)
+        if cached is not None:
+            return cached
+    try:
+        response_text = chat_with_model(config=config, model=model, messages=messages)
+    except Exception as exc:  # noqa: BLE001 - keep prototype error handling simple
+        return exc
+    response = _parse_with_retries(config, model, messages, response_text)
+    if isinstance(response, Exception):
+        return response
+    if cache_dir:
+        # A cache that cannot be written only costs a repeat call later; keep the response.
+        try:
+            put_cached_response(cache_dir, key, response, prompt_version=PROMPT_VERSION)
+        except OSError as exc:
+            warnings.warn(f"Could not write response cache entry: {exc}", RuntimeWarning, stacklevel=2)
+    return response
+
+
 def extract_claims_for_models(
     doc_id: str,
     segments: list[dict[str, Any]],
@@ -76,70 +166,78 @@ def extract_claims_for_models(
     chunk_overlap: int,
     on_status: Callable[[str], None] | None = None,
     run_id: str = "",
+    concurrency: int = 1,
+    cache_dir: Path | None = None,
 ) -> list[dict[str, Any]]:
-    """Run multi-model claim extraction and return deduplicated rows."""
+    """Run multi-model claim extraction and return deduplicated rows.
+
+    When `cache_dir` is set, backend responses are reused for byte-identical prompts.
+    """
 
     def emit(message: str) -> None:
         if on_status:
             on_status(message)
 
     chunks = build_chunks(segments, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    start_time_by_seg_id = {
-        str(segment.get("seg_id", "")).strip(): int(segment.get("start_time_s", 0))
-        for segment in segments
-        if str(segment.get("seg_id", "")).strip()
-    }
+    total_chunks = len(chunks)
+    chunk_labels = tuple(f"{chunk_index}/{total_chunks}" for chunk_index in range(1, total_chunks + 1))
+    start_time_by_seg_id: dict[str, int] = {}
+    for segment in segments:
+        seg_id = str(segment.get("seg_id", "")).strip()
+        if seg_id:
+            start_time_by_seg_id[seg_id] = int(segment.get("start_time_s", 0))
+
+    prompts = [
+        build_prompt(doc_id, build_segment_block(chunk, max_segments=len(chunk)), chunk_label=chunk_label)
+        for chunk, chunk_label in zip(chunks, chunk_labels)
+    ]
 
     all_rows_raw: list[dict[str, Any]] = []
-    for model in model_list:
-        emit(f"Running extraction with model: {model}")
-        model_rows: list[dict[str, Any]] = []
-        for chunk_index, chunk in enumerate(chunks, start=1):
-            segment_block = build_segment_block(chunk, max_segments=len(chunk))
-            messages = build_prompt(
-                doc_id,
-                segment_block,
-                chunk_label=f"{chunk_index}/{len(chunks)}",
-            )
-            try:
-                response_text = chat_with_model(config=config, model=model, messages=messages)
-            except urllib.error.URLError as exc:
-                emit(f"Failed request for model {model}, chunk {chunk_index}: {exc}")
-                continue
-            except Exception as exc:  # noqa: BLE001 - keep prototype error handling simple
-                emit(f"Model {model}, chunk {chunk_index} failed: {exc}")
-                continue
-
-            try:
-                payload = extract_json_object(response_text)
-            except ValueError as exc:
-                snippet = response_text[:240].replace("\n", " ")
-                emit(
-                    "Could not parse JSON response for "
-                    f"{model}, chunk {chunk_index}: {exc} (snippet: {snippet!r})"
-                )
-                continue
-
-            claims = payload.get("claims", [])
-            if not isinstance(claims, list):
-                emit(f"Model {model}, chunk {chunk_index} returned no claims list.")
-                continue
-
-            normalized_rows = normalize_claims(
-                doc_id=doc_id,
-                model=model,
-                raw_claims=claims,
-                start_time_by_seg_id=start_time_by_seg_id,
-                run_id=run_id,
-            )
-            model_rows.extend(normalized_rows)
-            emit(f"{model} chunk {chunk_index}/{len(chunks)}: {len(normalized_rows)} claims")
-
-        deduped_model_rows = dedupe_and_assign_claim_ids(model_rows)
-        all_rows_raw.extend(deduped_model_rows)
-        emit(
-            f"Model {model} produced {len(deduped_model_rows)} unique claims "
-            f"across {len(chunks)} chunks."
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, max(1, concurrency))) as executor:
+        # Backend calls are I/O-bound; map() keeps results in (model, chunk) order.
+        responses = executor.map(
+            _call_model,
+            repeat(config),
+            [model for model in model_list for _ in prompts],
+            [messages for _ in model_list for messages in prompts],
+            repeat(cache_dir),
         )
+        for model in model_list:
+            emit(f"Running extraction with model: {model}")
+            for chunk_index, chunk_label in enumerate(chunk_labels, start=1):
+                response = next(responses)
+                if isinstance(response, _UnparseableResponse):
+                    snippet = response.response_text[:240].replace("\n", " ")
+                    emit(
+                        "Could not parse JSON response for "
+                        f"{model}, chunk {chunk_index}: {response} (snippet: {snippet!r})"
+                    )
+                    continue
+                if isinstance(response, ModelBackendError):
+                    emit(f"Failed request for model {model}, chunk {chunk_index}: {response}")
+                    continue
+                if isinstance(response, Exception):
+                    emit(f"Model {model}, chunk {chunk_index} failed: {response}")
+                    continue
+
+                claims = response.parsed.get("claims", [])
+                if not isinstance(claims, list):
+                    emit(f"Model {model}, chunk {chunk_index} returned no claims list.")
+                    continue
+
+                normalized_rows = normalize_claims(
+                    doc_id=doc_id,
+                    model=model,
+                    raw_claims=claims,
+                    start_time_by_seg_id=start_time_by_seg_id,
+                    run_id=run_id,
+                )
+                all_rows_raw.extend(normalized_rows)
+                emit(f"{model} chunk {chunk_label}: {len(normalized_rows)} claims")
 
-    return dedupe_and_assign_claim_ids(all_rows_raw)
+    # The dedupe key includes the model, so one global pass also dedupes within each model.
+    final_rows = dedupe_and_assign_claim_ids(all_rows_raw)
+    unique_counts = Counter(row.get("model", "") for row in final_rows)
+    for model in model_list:
+        emit(f"Model {model} produced {unique_counts[model]} unique claims across {total_chunks} chunks.")
+    return final_rows
@@ -0,0 +1,101 @@
+"""Content-addressable on-disk cache for model backend responses."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# Also expires responses whose model tag was re-pulled with new weights under the same name.
+CACHE_TTL_S = 7 * 24 * 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Raw response text plus the JSON payload parsed from it."""
+
+    raw: str
+    parsed: dict[str, Any]
+
+
+def build_cache_key(
+    prompt_version: str,
+    base_url: str,
+    model: str,
+    messages: Iterable[dict[str, str]],
+    request_options: object = None,
+) -> str:
+    """Hash the prompt version, backend, model, request options, and messages into a cache key.
+
+    `request_options` is any JSON-serializable value, such as the sampling and format settings.
+    """
+    digest = hashlib.sha256()
+    options = orjson.dumps(request_options, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    fields = [prompt_version, base_url.rstrip("/"), model, options]
+    for message in messages:
+        fields.extend((message.get("role", ""), message.get("content", "")))
+    for field in fields:
+        # Length-prefix each field so ("ab", "c") and ("a", "bc") hash differently.
+        encoded = field.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def get_cached_response(cache_dir: Path, key: str) -> CachedResponse | None:
+    """Return the cached response for a key, or None when missing, expired, or malformed."""
+    try:
+        entry = orjson.loads(_entry_path(cache_dir, key).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    expires_at = entry.get("expires_at")
+    # bool is an int subclass, so reject it explicitly along with non-numbers.
+    if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+        return None
+    if expires_at <= time.time():
+        return None
+    raw = entry.get("raw")
+    parsed = entry.get("parsed")
+    if not isinstance(raw, str) or not isinstance(parsed, dict):
+        return None
+    return CachedResponse(raw=raw, parsed=parsed)
+
+
+def put_cached_response(
+    cache_dir: Path,
+    key: str,
+    response: CachedResponse,
+    prompt_version: str,
+    ttl_s: float = CACHE_TTL_S,
+) -> None:
+    """Store a response and its parsed payload under a key, expiring after `ttl_s` seconds."""
+    path = _entry_path(cache_dir, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "raw": response.raw,
+        "parsed": response.parsed,
+        "prompt_version": prompt_version,
+        "expires_at": time.time() + ttl_s,
+    }
+    # Write to a temp file and rename so concurrent workers never read a partial entry.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(orjson.dumps(entry))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import urllib.error
-from uuid import uuid4
 from collections.abc import Callable
 from pathlib import Path
+from secrets import token_hex
 from typing import Any
 
 from proof_please.core.io import load_transcript
-from proof_please.core.model_client import list_available_models
+from proof_please.core.model_client import ModelBackendError, list_available_models
 from proof_please.pipeline.extract_claims import extract_claims_for_models
 from proof_please.pipeline.generate_queries import choose_query_model, generate_validation_queries
 from proof_please.pipeline.models import ModelBackendConfig
@@ -17,7 +16,10 @@ from proof_please.pipeline.models import ModelBackendConfig
 
 def parse_model_list(models: str) -> list[str]:
     """Parse comma-separated model list."""
-    return [model.strip() for model in models.split(",") if model.strip()]
+    models = models.strip()
+    if "," not in models:
+        return [models] if models else []
+    return [model for model in (name.strip() for name in models.split(",")) if model]
 
 
 def validate_common_args(timeout: float, max_segments: int) -> None:
@@ -38,13 +40,14 @@ def fetch_available_models(config: ModelBackendConfig) -> list[str]:
     """Fetch available local models with user-friendly errors."""
     try:
         return list_available_models(config)
-    except urllib.error.URLError as exc:
+    except ModelBackendError as exc:
         raise ConnectionError(f"Could not connect to model backend at {config.base_url}: {exc}") from exc
 
 
 def find_missing_models(requested_models: list[str], available_models: list[str]) -> list[str]:
     """Return model names requested by user but absent from backend list."""
-    return [name for name in requested_models if name not in available_models]
+    available = set(available_models)
+    return [name for name in requested_models if name not in available]
 
 
 def run_claim_extraction(
@@ -56,12 +59,16 @@ def run_claim_extraction(
     chunk_overlap: int,
     on_status: Callable[[str], None] | None = None,
     run_id: str | None = None,
+    concurrency: int = 1,
+    cache_dir: Path | None = None,
 ) -> list[dict[str, Any]]:
     """Run transcript claim extraction and return deduplicated claim rows."""
     if not model_list:
         raise ValueError("No models provided.")
+    if concurrency < 1:
+        raise ValueError("--concurrency must be >= 1")
 
-    run_id = run_id or f"run_{uuid4().hex[:12]}"
+    run_id = run_id or f"run_{token_hex(6)}"
     validate_path_exists(transcript, "--transcript")
     validate_common_args(timeout=config.timeout, max_segments=max_segments)
 
@@ -78,6 +85,8 @@ def run_claim_extraction(
         chunk_overlap=chunk_overlap,
         on_status=on_status,
         run_id=run_id,
+        concurrency=concurrency,
+        cache_dir=cache_dir,
     )
 
 
@@ -98,7 +107,7 @@ def run_query_generation(
         if on_status:
             on_status(message)
 
-    run_id = run_id or f"run_{uuid4().hex[:12]}"
+    run_id = run_id or f"run_{token_hex(6)}"
 
     selected_query_model = choose_query_model(
         query_model=query_model,
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
-import urllib.error
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from proof_please.core.model_client import chat_with_model, list_available_models
+import pytest
+import requests
+
+from proof_please.core.model_client import (
+    ModelBackendError,
+    ModelBackendHTTPError,
+    _HTTP_ADAPTER,
+    _ROUTE_CACHE,
+    _request_json,
+    chat_with_model,
+    list_available_models,
+)
 from proof_please.pipeline.models import ModelBackendConfig
 
 
+@pytest.fixture(autouse=True)
+def _clear_route_cache():
+    _ROUTE_CACHE.clear()
+    yield
+    _ROUTE_CACHE.clear()
+
+
 def test_list_available_models_returns_empty_after_successful_empty_probe(monkeypatch) -> None:
     def fake_request_json(url: str, timeout: float, method: str, payload=None):
         if url.endswith("/v1/models"):
             return {"data": []}
         if url.endswith("/api/tags"):
-            raise urllib.error.HTTPError(url, 404, "Not Found", hdrs=None, fp=None)
+            raise ModelBackendHTTPError(url, 404, "Not Found", "")
         raise AssertionError(f"Unexpected URL: {url}")
 
     monkeypatch.setattr("proof_please.core.model_client._request_json", fake_request_json)
@@ -46,3 +67,147 @@ def test_chat_with_model_falls_back_when_chat_payload_is_unparsable(monkeypatch)
         "http://127.0.0.1:11434/v1/chat/completions",
         "http://127.0.0.1:11434/api/chat",
     ]
+
+
+def test_request_json_raises_backend_http_error_with_body(monkeypatch) -> None:
+    class FakeSession:
+        def request(self, method: str, url: str, data=None, timeout=None) -> requests.Response:
+            response = requests.Response()
+            response.status_code = 404
+            response.reason = "Not Found"
+            response.url = url
+            response.raw = io.BytesIO(b'{"error": "model not found"}')
+            return response
+
+    monkeypatch.setattr("proof_please.core.model_client._http_session", lambda: FakeSession())
+
+    with pytest.raises(ModelBackendHTTPError) as exc_info:
+        _request_json(url="http://127.0.0.1:11434/v1/models", timeout=30, method="GET")
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.body == '{"error": "model not found"}'
+
+
+def test_request_json_separates_bad_urls_from_connection_failures(monkeypatch) -> None:
+    def session_raising(exc: Exception):
+        class FakeSession:
+            def request(self, method: str, url: str, data=None, timeout=None) -> requests.Response:
+                raise exc
+
+        return lambda: FakeSession()
+
+    monkeypatch.setattr(
+        "proof_please.core.model_client._http_session",
+        session_raising(requests.exceptions.MissingSchema("No scheme supplied")),
+    )
+    with pytest.raises(ValueError, match="No scheme supplied"):
+        _request_json(url="localhost/v1/models", timeout=30, method="GET")
+
+    monkeypatch.setattr(
+        "proof_please.core.model_client._http_session",
+        session_raising(requests.ConnectionError("Connection refused")),
+    )
+    with pytest.raises(ModelBackendError, match="Connection refused"):
+        _request_json(url="http://127.0.0.1:1/v1/models", timeout=30, method="GET")
+
+
+def test_chat_with_model_tries_last_working_variant_first(monkeypatch) -> None:
+    called_urls: list[str] = []
+
+    def fake_request_json(url: str, timeout: float, method: str, payload=None):
+        called_urls.append(url)
+        if url.endswith("/v1/chat/completions"):
+            raise ModelBackendHTTPError(url, 404, "Not Found", "")
+        return {"message": {"content": '{"claims": []}'}}
+
+    monkeypatch.setattr("proof_please.core.model_client._request_json", fake_request_json)
+    config = ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30)
+    messages = [{"role": "user", "content": "hi"}]
+
+    chat_with_model(config=config, model="qwen3:4b", messages=messages)
+    called_urls.clear()
+    content = chat_with_model(config=config, model="qwen3:4b", messages=messages)
+
+    assert content == '{"claims": []}'
+    assert called_urls == ["http://127.0.0.1:11434/api/chat"]
+
+
+def test_chat_with_model_does_not_remember_content_error_fallback(monkeypatch) -> None:
+    called_urls: list[str] = []
+    replies = iter([{"choices": [{"index": 0}]}])
+
+    def fake_request_json(url: str, timeout: float, method: str, payload=None):
+        called_urls.append(url)
+        if payload.get("response_format"):
+            return next(replies, {"choices": [{"message": {"content": '{"claims": []}'}}]})
+        return {"choices": [{"message": {"content": '{"claims": [1]}'}}]}
+
+    monkeypatch.setattr("proof_please.core.model_client._request_json", fake_request_json)
+    config = ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30)
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert chat_with_model(config=config, model="qwen3:4b", messages=messages) == '{"claims": [1]}'
+    called_urls.clear()
+    content = chat_with_model(config=config, model="qwen3:4b", messages=messages)
+
+    assert content == '{"claims": []}'
+    assert called_urls == ["http://127.0.0.1:11434/v1/chat/completions"]
+
+
+def test_chat_with_model_remembers_routes_per_model(monkeypatch) -> None:
+    called: list[tuple[str, str]] = []
+
+    def fake_request_json(url: str, timeout: float, method: str, payload=None):
+        called.append((payload["model"], url))
+        if payload["model"] == "legacy" and url.endswith("/v1/chat/completions"):
+            raise ModelBackendHTTPError(url, 404, "Not Found", "")
+        return {"message": {"content": '{"claims": []}'}}
+
+    monkeypatch.setattr("proof_please.core.model_client._request_json", fake_request_json)
+    config = ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30)
+    messages = [{"role": "user", "content": "hi"}]
+
+    chat_with_model(config=config, model="legacy", messages=messages)
+    called.clear()
+    chat_with_model(config=config, model="qwen3:4b", messages=messages)
+
+    assert called == [("qwen3:4b", "http://127.0.0.1:11434/v1/chat/completions")]
+
+
+def test_chat_with_model_uses_one_session_per_thread_for_concurrent_calls(monkeypatch) -> None:
+    workers = 4
+    barrier = threading.Barrier(workers)
+    sessions_by_thread: dict[int, set[int]] = {}
+    adapters: set[int] = set()
+    lock = threading.Lock()
+
+    def fake_request(self, method: str, url: str, data=None, timeout=None) -> requests.Response:
+        with lock:
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(self))
+            adapters.add(id(self.get_adapter(url)))
+        barrier.wait(timeout=5)
+        model = json.loads(data)["model"]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"message": {"content": model}}).encode()
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    config = ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30)
+    models = [f"m{index}" for index in range(workers)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = list(
+            executor.map(
+                lambda model: chat_with_model(
+                    config=config, model=model, messages=[{"role": "user", "content": "hi"}]
+                ),
+                models,
+            )
+        )
+
+    assert contents == models
+    assert len(sessions_by_thread) == workers
+    assert all(len(sessions) == 1 for sessions in sessions_by_thread.values())
+    assert len(set().union(*sessions_by_thread.values())) == workers
+    assert adapters == {id(_HTTP_ADAPTER)}
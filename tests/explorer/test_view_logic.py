@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+from proof_please.explorer.linking import compute_link_diagnostics
 from proof_please.explorer.models import ClaimRow, QueryRow
 from proof_please.explorer.view_logic import (
     build_claims_to_queries_index,
+    build_debug_tabs_index,
+    build_diagnostics_tables,
+    build_episode_browser_index,
     build_episode_claim_rows,
+    build_segment_markup,
     build_segment_to_claims_index,
     build_source_episode_index,
     build_source_summary,
     default_claim_for_segment,
+    episode_claim_matches_picker,
+    filter_claim_rows,
     filter_episode_claim_rows,
+    find_matching_segment_ids,
+    format_timestamp,
+    make_claim_filter,
+    normalize_search_text,
+    query_matches_filters,
+    truncate_preview,
 )
 from proof_please.pipeline.models import TranscriptDocument
 
@@ -56,13 +69,17 @@ def _build_transcript(
     *,
     source: dict[str, object] | None = None,
     episode: dict[str, object] | None = None,
+    segment_texts: list[str] | None = None,
 ) -> TranscriptDocument:
     return TranscriptDocument.model_validate(
         {
             "doc_id": doc_id,
             "source": source or {},
             "episode": episode or {},
-            "segments": [],
+            "segments": [
+                {"seg_id": f"seg_{index:06d}", "text": text}
+                for index, text in enumerate(segment_texts or [])
+            ],
         }
     )
 
@@ -111,7 +128,124 @@ def test_build_source_episode_index_groups_and_sorts_by_episode_title() -> None:
     assert any(group.source_key == "unknown_source" for group in groups)
 
 
-def test_build_segment_to_claims_index_uses_doc_and_seg_id_keys() -> None:
+def test_build_episode_browser_index_bundles_dataset_groupings() -> None:
+    transcripts = {"doc_1": _build_transcript("doc_1", source={"url": "https://alpha.fm/e/1"})}
+    claims = [_build_claim("clm_1", "doc_1", evidence_seg_ids=["seg_000002"])]
+    queries = [_build_query("clm_1", "Query 1")]
+
+    index = build_episode_browser_index(transcripts, claims, queries)
+
+    assert [group.source_key for group in index.source_groups] == ["alpha.fm"]
+    assert index.episodes_by_doc_id["doc_1"].query_count == 1
+    assert [row.query for row in index.queries_by_claim_id["clm_1"]] == ["Query 1"]
+    assert [row.claim_id for row in index.segment_to_claims["doc_1"]["seg_000002"]] == ["clm_1"]
+    assert [row.claim_id for row in index.episode_rows_by_doc_id["doc_1"]] == ["clm_1"]
+    assert index.claims_by_doc_and_id[("doc_1", "clm_1")].doc_id == "doc_1"
+    assert index.source_summaries["alpha.fm"].claim_count == 1
+    assert index.source_summaries["alpha.fm"].query_count == 1
+
+
+def test_build_debug_tabs_index_sorts_claims_and_collects_options() -> None:
+    claims = [
+        _build_claim("clm_2", "doc_2", speaker="Guest"),
+        _build_claim("clm_1", "doc_1", speaker=""),
+        _build_claim("clm_3", "doc_1", speaker="Host"),
+    ]
+    queries = [_build_query("clm_1", "Query 1")]
+
+    index = build_debug_tabs_index(claims, queries)
+
+    assert [row.claim_id for row in index.claims] == ["clm_1", "clm_2", "clm_3"]
+    assert [row.query for row in index.queries_by_claim_id["clm_1"]] == ["Query 1"]
+    assert [row.claim_id for row in index.claims_by_doc_id["doc_1"]] == ["clm_1", "clm_3"]
+    assert index.doc_ids == ("doc_1", "doc_2")
+    assert index.speakers == ("Guest", "Host")
+    assert index.preferred_sources == ("systematic review",)
+    assert index.claim_labels[("doc_1", "clm_1")].startswith("clm_1 | Unknown speaker | ")
+
+
+def test_claim_lookups_are_scoped_to_the_document() -> None:
+    transcripts = {doc_id: _build_transcript(doc_id) for doc_id in ("doc_1", "doc_2")}
+    claims = [
+        _build_claim("clm_000001", "doc_1", speaker="Host"),
+        _build_claim("clm_000001", "doc_2", speaker="Guest"),
+    ]
+
+    browser_index = build_episode_browser_index(transcripts, claims, [])
+    debug_index = build_debug_tabs_index(claims, [])
+
+    assert browser_index.claims_by_doc_and_id[("doc_1", "clm_000001")].speaker == "Host"
+    assert browser_index.claims_by_doc_and_id[("doc_2", "clm_000001")].speaker == "Guest"
+    assert debug_index.claim_labels[("doc_2", "clm_000001")].startswith("clm_000001 | Guest | ")
+
+
+def test_linked_queries_resolve_claims_like_link_diagnostics() -> None:
+    claims = [
+        _build_claim("clm_000001", "doc_1", speaker="Host"),
+        _build_claim("clm_000001", "doc_2", speaker="Guest"),
+    ]
+    queries = [
+        QueryRow.model_validate({"claim_id": "clm_000001", "query": "Query", "doc_id": "doc_2"}),
+        _build_query("clm_404", "Orphan query"),
+    ]
+
+    linked, orphan = build_debug_tabs_index(claims, queries).linked_queries
+    diagnostics = compute_link_diagnostics(claims, queries, {})
+
+    assert linked.linked_claim is claims[0]
+    assert orphan.linked_claim is None
+    assert diagnostics.orphan_queries == [orphan.query]
+
+
+def test_build_diagnostics_tables_flattens_issue_sections() -> None:
+    claims = [_build_claim("clm_1", "doc_missing")]
+    queries = [_build_query("clm_404", "Orphan query")]
+
+    tables = build_diagnostics_tables(compute_link_diagnostics(claims, queries, {}))
+
+    assert tables.orphan_queries == {"claim_id": ["clm_404"], "query": ["Orphan query"]}
+    assert tables.claims_without_queries["claim_id"] == ["clm_1"]
+    assert tables.claims_missing_transcript_doc["doc_id"] == ["doc_missing"]
+    assert tables.claims_without_evidence == {"claim_id": [], "doc_id": [], "claim_text": []}
+    assert tables.missing_evidence_links["seg_id"] == []
+
+
+def test_find_matching_segment_ids_uses_precomputed_folded_texts() -> None:
+    transcripts = {
+        "doc_1": _build_transcript(
+            "doc_1",
+            segment_texts=["LDL and the Heart", "Sleep matters", "heart rate zones"],
+        )
+    }
+    index = build_episode_browser_index(transcripts, [], [])
+    search_texts = index.segment_search_texts["doc_1"]
+    assert index.segment_ids_by_doc_id["doc_1"] == {"seg_000000", "seg_000001", "seg_000002"}
+
+    assert find_matching_segment_ids(transcripts["doc_1"], search_texts, " HEART ") == {
+        "seg_000000",
+        "seg_000002",
+    }
+    assert find_matching_segment_ids(transcripts["doc_1"], search_texts, "  ") == frozenset()
+
+
+def test_build_segment_markup_escapes_display_fields() -> None:
+    document = _build_transcript("doc_1", segment_texts=["LDL <b>&</b> risk"])
+
+    (markup,) = build_segment_markup(document)
+
+    assert markup.seg_id == "seg_000000"
+    assert markup.timestamp == "00:00"
+    assert markup.speaker == "Unknown speaker"
+    assert markup.text == "LDL &lt;b&gt;&amp;&lt;/b&gt; risk"
+
+
+def test_format_timestamp_adds_hours_only_when_needed() -> None:
+    assert format_timestamp(-5) == "00:00"
+    assert format_timestamp(125) == "02:05"
+    assert format_timestamp(3725) == "01:02:05"
+
+
+def test_build_segment_to_claims_index_nests_seg_ids_under_doc_ids() -> None:
     claims = [
         _build_claim("clm_1", "doc_1", evidence_seg_ids=["seg_000001"]),
         _build_claim("clm_2", "doc_2", evidence_seg_ids=["seg_000001"]),
@@ -120,9 +254,9 @@ def test_build_segment_to_claims_index_uses_doc_and_seg_id_keys() -> None:
 
     index = build_segment_to_claims_index(claims)
 
-    assert [row.claim_id for row in index[("doc_1", "seg_000001")]] == ["clm_1", "clm_3"]
-    assert [row.claim_id for row in index[("doc_2", "seg_000001")]] == ["clm_2"]
-    assert [row.claim_id for row in index[("doc_1", "seg_000002")]] == ["clm_3"]
+    assert [row.claim_id for row in index["doc_1"]["seg_000001"]] == ["clm_1", "clm_3"]
+    assert [row.claim_id for row in index["doc_2"]["seg_000001"]] == ["clm_2"]
+    assert [row.claim_id for row in index["doc_1"]["seg_000002"]] == ["clm_3"]
 
 
 def test_filter_episode_claim_rows_filters_by_speaker_type_and_query_presence() -> None:
@@ -145,6 +279,112 @@ def test_filter_episode_claim_rows_filters_by_speaker_type_and_query_presence()
     assert [row.claim_id for row in filtered] == ["clm_3"]
 
 
+def test_episode_search_spans_fields_but_picker_matches_each_field() -> None:
+    claim = _build_claim("CLM_1", "doc_1", speaker="Dr Smith", claim_type="Nutrition_Claim")
+
+    rows = build_episode_claim_rows("doc_1", [claim], {})
+    filters = {"selected_speakers": [], "selected_claim_types": [], "only_with_queries": False}
+
+    assert rows[0].search_blob == "clm_1 dr smith nutrition_claim claim text clm_1"
+    assert filter_episode_claim_rows(rows, search_text="NUTRITION_CLAIM claim text", **filters) == rows
+    assert episode_claim_matches_picker(rows[0], "dr smith")
+    assert episode_claim_matches_picker(rows[0], "claim text clm_1")
+    assert not episode_claim_matches_picker(rows[0], "nutrition")
+    assert not episode_claim_matches_picker(rows[0], "clm_1 dr")
+
+
+def test_make_claim_filter_searches_lowercased_claim_fields() -> None:
+    claim = _build_claim("clm_1", "Doc_A", speaker="Dr Smith", claim_type="medical_risk")
+    filters = {
+        "selected_speakers": frozenset({"Dr Smith"}),
+        "selected_claim_types": frozenset(),
+        "selected_models": frozenset(),
+    }
+
+    assert make_claim_filter(search_text=normalize_search_text("  DOC_A "), **filters)(claim)
+    assert make_claim_filter(search_text="dr smith", **filters)(claim)
+    assert not make_claim_filter(search_text="nutrition", **filters)(claim)
+
+
+def test_claim_search_uses_unicode_case_folding() -> None:
+    claim = ClaimRow.model_validate(
+        {"claim_id": "clm_1", "doc_id": "doc_1", "claim_text": "Walking on the Straße helps"}
+    )
+
+    assert normalize_search_text("STRASSE") in claim.search_blob
+
+
+def test_claim_rows_share_interned_low_cardinality_fields() -> None:
+    first = _build_claim("clm_1", "doc_" + "1", speaker="Ho" + "st")
+    second = _build_claim("clm_2", "".join(["doc_", "1"]), speaker="".join(["Ho", "st"]))
+
+    assert first.doc_id is second.doc_id
+    assert first.speaker is second.speaker
+
+
+def test_filter_claim_rows_applies_search_with_and_without_field_filters() -> None:
+    claims = [
+        _build_claim("clm_1", "doc_1", speaker="Host"),
+        _build_claim("clm_2", "doc_2", speaker="Guest"),
+    ]
+    debug_index = build_debug_tabs_index(claims, [_build_query("clm_2", "Query 2")])
+    no_filters = {
+        "selected_doc": "All",
+        "selected_speakers": frozenset(),
+        "selected_claim_types": frozenset(),
+        "selected_models": frozenset(),
+        "only_with_queries": False,
+    }
+
+    def filtered_ids(search_text: str = "", **overrides: object) -> list[str]:
+        filters = {**no_filters, **overrides}
+        return [row.claim_id for row in filter_claim_rows(debug_index, search_text=search_text, **filters)]
+
+    assert filtered_ids() == ["clm_1", "clm_2"]
+    assert filtered_ids("guest") == ["clm_2"]
+    assert filtered_ids(selected_doc="doc_1") == ["clm_1"]
+    assert filtered_ids(selected_doc="doc_1", selected_speakers=frozenset({"Guest"})) == []
+    assert filtered_ids(only_with_queries=True) == ["clm_2"]
+
+
+def test_query_matches_filters_searches_query_and_linked_claim_text() -> None:
+    claim = _build_claim("clm_1", "doc_1", speaker="Host")
+    linked, orphan = build_debug_tabs_index(
+        [claim],
+        [_build_query("clm_1", "Does LDL matter?"), _build_query("clm_404", "Claim text")],
+    ).linked_queries
+    filters = {
+        "selected_claim_types": frozenset(),
+        "selected_source_set": set(),
+        "only_orphans": False,
+    }
+
+    assert linked.linked_claim is claim
+    assert orphan.linked_claim is None
+    assert query_matches_filters(linked, search_text="ldl", **filters)
+    assert query_matches_filters(linked, search_text="claim text clm_1", **filters)
+    assert not query_matches_filters(linked, search_text="host", **filters)
+    assert query_matches_filters(linked, search_text="checks the claim. claim text", **filters)
+    assert not query_matches_filters(orphan, search_text="claim text clm_1", **filters)
+    assert query_matches_filters(orphan, search_text="claim text", **filters)
+
+
+def test_query_matches_filters_requires_overlapping_preferred_source() -> None:
+    (linked_query,) = build_debug_tabs_index(
+        [], [_build_query("clm_1", "Does LDL matter?")]
+    ).linked_queries
+    filters = {
+        "selected_claim_types": frozenset(),
+        "only_orphans": False,
+        "search_text": "",
+    }
+
+    assert query_matches_filters(
+        linked_query, selected_source_set={"meta-analysis", "systematic review"}, **filters
+    )
+    assert not query_matches_filters(linked_query, selected_source_set={"meta-analysis"}, **filters)
+
+
 def test_default_claim_for_segment_uses_boldness_then_claim_id() -> None:
     claims = [
         _build_claim("clm_2", "doc_1", boldness_rating=3),
@@ -181,3 +421,9 @@ def test_build_source_summary_counts_and_top_speakers() -> None:
     assert summary.claim_count == 4
     assert summary.query_count == 3
     assert summary.top_speakers == ("Alice", "Bob", "Carol")
+
+
+def test_truncate_preview_keeps_short_text_and_trims_long_text() -> None:
+    assert truncate_preview("short", limit=10) == "short"
+    assert truncate_preview("walking daily helps", limit=11) == "walking..."
+    assert len(truncate_preview("x" * 200)) == 96
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from proof_please.pipeline.extract_claims import extract_claims_for_models
+from proof_please.pipeline.models import ModelBackendConfig
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_extract_claims_for_models_keeps_model_chunk_order(monkeypatch, concurrency: int) -> None:
+    segments = [
+        {"seg_id": f"seg_00000{index}", "start_time_s": index, "speaker": "A", "text": f"text {index}"}
+        for index in range(1, 5)
+    ]
+
+    def fake_chat_with_model(config: ModelBackendConfig, model: str, messages: list[dict[str, str]]) -> str:
+        first_seg_id = "seg_000001" if "seg_000001" in messages[1]["content"] else "seg_000003"
+        if first_seg_id == "seg_000001":
+            time.sleep(0.05)
+        if model == "broken":
+            raise RuntimeError("backend down")
+        claim = {
+            "speaker": "A",
+            "claim_text": f"{model} claim from {first_seg_id}",
+            "evidence": [{"seg_id": first_seg_id, "quote": "q"}],
+        }
+        return json.dumps({"claims": [claim]})
+
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.chat_with_model", fake_chat_with_model)
+    statuses: list[str] = []
+
+    rows = extract_claims_for_models(
+        doc_id="doc_1",
+        segments=segments,
+        model_list=["m1", "broken", "m2"],
+        config=ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30),
+        chunk_size=2,
+        chunk_overlap=0,
+        on_status=statuses.append,
+        run_id="run_test",
+        concurrency=concurrency,
+    )
+
+    assert [row["claim_text"] for row in rows] == [
+        "m1 claim from seg_000001",
+        "m1 claim from seg_000003",
+        "m2 claim from seg_000001",
+        "m2 claim from seg_000003",
+    ]
+    assert [row["claim_id"] for row in rows] == ["clm_000001", "clm_000002", "clm_000003", "clm_000004"]
+    assert "Model broken, chunk 1 failed: backend down" in statuses
+    assert "Model m1 produced 2 unique claims across 2 chunks." in statuses
+    assert "Model broken produced 0 unique claims across 2 chunks." in statuses
+    assert statuses.index("Running extraction with model: broken") < statuses.index(
+        "Running extraction with model: m2"
+    )
+
+
+def test_extract_claims_for_models_reuses_cached_responses(monkeypatch, tmp_path) -> None:
+    segments = [{"seg_id": "seg_000001", "start_time_s": 1, "speaker": "A", "text": "text"}]
+    calls: list[str] = []
+
+    def fake_chat_with_model(config: ModelBackendConfig, model: str, messages: list[dict[str, str]]) -> str:
+        calls.append(model)
+        claim = {"speaker": "A", "claim_text": "cached", "evidence": [{"seg_id": "seg_000001", "quote": "q"}]}
+        return json.dumps({"claims": [claim]})
+
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.chat_with_model", fake_chat_with_model)
+
+    def run() -> list[dict]:
+        return extract_claims_for_models(
+            doc_id="doc_1",
+            segments=segments,
+            model_list=["m1"],
+            config=ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30),
+            chunk_size=2,
+            chunk_overlap=0,
+            cache_dir=tmp_path,
+        )
+
+    first = run()
+    second = run()
+
+    assert calls == ["m1"]
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+    assert [row["claim_text"] for row in second] == [row["claim_text"] for row in first] == ["cached"]
+
+
+def test_extract_claims_for_models_keeps_response_when_cache_write_fails(monkeypatch, tmp_path) -> None:
+    segments = [{"seg_id": "seg_000001", "start_time_s": 1, "speaker": "A", "text": "text"}]
+    claim = {"speaker": "A", "claim_text": "uncached", "evidence": [{"seg_id": "seg_000001", "quote": "q"}]}
+    monkeypatch.setattr(
+        "proof_please.pipeline.extract_claims.chat_with_model",
+        lambda config, model, messages: json.dumps({"claims": [claim]}),
+    )
+
+    def failing_put(*args: object, **kwargs: object) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.put_cached_response", failing_put)
+
+    with pytest.warns(RuntimeWarning, match="No space left on device"):
+        rows = extract_claims_for_models(
+            doc_id="doc_1",
+            segments=segments,
+            model_list=["m1"],
+            config=ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30),
+            chunk_size=2,
+            chunk_overlap=0,
+            cache_dir=tmp_path,
+        )
+
+    assert [row["claim_text"] for row in rows] == ["uncached"]
+
+
+def test_extract_claims_for_models_does_not_cache_unparseable_responses(monkeypatch, tmp_path) -> None:
+    segments = [{"seg_id": "seg_000001", "start_time_s": 1, "speaker": "A", "text": "text"}]
+    monkeypatch.setattr(
+        "proof_please.pipeline.extract_claims.chat_with_model",
+        lambda config, model, messages: "no json here",
+    )
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.PARSE_RETRY_BACKOFF_S", 0.0)
+    statuses: list[str] = []
+
+    rows = extract_claims_for_models(
+        doc_id="doc_1",
+        segments=segments,
+        model_list=["m1"],
+        config=ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30),
+        chunk_size=2,
+        chunk_overlap=0,
+        on_status=statuses.append,
+        cache_dir=tmp_path,
+    )
+
+    assert rows == []
+    assert any(status.startswith("Could not parse JSON response for m1, chunk 1") for status in statuses)
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_extract_claims_for_models_retries_unparseable_responses_with_feedback(monkeypatch) -> None:
+    segments = [{"seg_id": "seg_000001", "start_time_s": 1, "speaker": "A", "text": "text"}]
+    requests: list[list[dict[str, str]]] = []
+
+    def fake_chat_with_model(config: ModelBackendConfig, model: str, messages: list[dict[str, str]]) -> str:
+        requests.append(messages)
+        if len(requests) == 1:
+            return "Sorry, here are the claims"
+        claim = {"speaker": "A", "claim_text": "retried", "evidence": [{"seg_id": "seg_000001", "quote": "q"}]}
+        return json.dumps({"claims": [claim]})
+
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.chat_with_model", fake_chat_with_model)
+    monkeypatch.setattr("proof_please.pipeline.extract_claims.PARSE_RETRY_BACKOFF_S", 0.0)
+
+    rows = extract_claims_for_models(
+        doc_id="doc_1",
+        segments=segments,
+        model_list=["m1"],
+        config=ModelBackendConfig(base_url="http://127.0.0.1:11434", timeout=30),
+        chunk_size=2,
+        chunk_overlap=0,
+    )
+
+    assert [row["claim_text"] for row in rows] == ["retried"]
+    assert len(requests) == 2
+    assert requests[1][:2] == requests[0]
+    assert requests[1][2] == {"role": "assistant", "content": "Sorry, here are the claims"}
+    assert requests[1][3]["content"].startswith("Your output had error: No JSON object found")
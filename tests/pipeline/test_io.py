@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from proof_please.core.io import load_claims_jsonl, load_transcript, write_jsonl
+from proof_please.core.io import extract_json_object, load_claims_jsonl, load_transcript, write_jsonl
 
 
 def test_write_and_load_claims_jsonl_roundtrip(tmp_path: Path) -> None:
@@ -41,3 +41,30 @@ def test_load_transcript_errors_when_missing_segments(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Transcript JSON missing segments"):
         load_transcript(path)
+
+
+def test_write_jsonl_keeps_unicode_and_load_skips_blank_lines(tmp_path: Path) -> None:
+    output = tmp_path / "claims.jsonl"
+    write_jsonl(output, [{"claim_id": "clm_000001", "claim_text": "Café ☕ helps"}])
+    output.write_text(output.read_text(encoding="utf-8") + "\n  \n", encoding="utf-8")
+
+    assert "Café ☕ helps" in output.read_text(encoding="utf-8")
+    assert load_claims_jsonl(output) == [{"claim_id": "clm_000001", "claim_text": "Café ☕ helps"}]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"claims": []}', {"claims": []}),
+        ('```json\n{"claims": [1]}\n```', {"claims": [1]}),
+        ('Here you go: {"a": 1} and finally {"claims": [2]} done.', {"claims": [2]}),
+        ('{"boldness": Infinity}', {"boldness": float("inf")}),
+    ],
+)
+def test_extract_json_object_parses_direct_and_embedded_objects(text: str, expected: dict) -> None:
+    assert extract_json_object(text) == expected
+
+
+def test_extract_json_object_rejects_text_without_objects() -> None:
+    with pytest.raises(ValueError, match="No JSON object"):
+        extract_json_object("[1, 2, 3]")
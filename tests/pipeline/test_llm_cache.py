@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import time
+
+from proof_please.pipeline.llm_cache import (
+    CACHE_TTL_S,
+    CachedResponse,
+    build_cache_key,
+    get_cached_response,
+    put_cached_response,
+)
+
+BASE_URL = "http://127.0.0.1:11434"
+MESSAGES = [{"role": "user", "content": "seg_000001 | 0 | A | text"}]
+
+
+def test_build_cache_key_separates_fields() -> None:
+    key = build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+
+    assert key == build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+    assert key != build_cache_key("v2", BASE_URL, "m1", MESSAGES)
+    assert key != build_cache_key("v1", BASE_URL, "m2", MESSAGES)
+    assert key != build_cache_key("v1", "http://10.0.0.2:11434", "m1", MESSAGES)
+    assert key != build_cache_key("v1", BASE_URL, "m1", MESSAGES, {"temperature": 0.7})
+    assert build_cache_key("v1", BASE_URL, "m1", MESSAGES, {"a": 1, "b": 2}) == build_cache_key(
+        "v1", f"{BASE_URL}/", "m1", MESSAGES, {"b": 2, "a": 1}
+    )
+    assert build_cache_key("v1", BASE_URL, "ab", [{"role": "c"}]) != build_cache_key(
+        "v1", BASE_URL, "a", [{"role": "bc"}]
+    )
+
+
+def test_cached_response_round_trip(tmp_path) -> None:
+    key = build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+    assert get_cached_response(tmp_path, key) is None
+
+    response = CachedResponse(raw='Sure: {"claims": []}', parsed={"claims": []})
+    put_cached_response(tmp_path, key, response, prompt_version="v1")
+    assert get_cached_response(tmp_path, key) == response
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_cached_response_expires_after_ttl(monkeypatch, tmp_path) -> None:
+    key = build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+    response = CachedResponse(raw="{}", parsed={})
+    now = time.time()
+    monkeypatch.setattr("proof_please.pipeline.llm_cache.time.time", lambda: now)
+    put_cached_response(tmp_path, key, response, prompt_version="v1")
+
+    monkeypatch.setattr("proof_please.pipeline.llm_cache.time.time", lambda: now + CACHE_TTL_S - 1)
+    assert get_cached_response(tmp_path, key) == response
+    monkeypatch.setattr("proof_please.pipeline.llm_cache.time.time", lambda: now + CACHE_TTL_S)
+    assert get_cached_response(tmp_path, key) is None
+
+    put_cached_response(tmp_path, key, response, prompt_version="v1", ttl_s=-1)
+    assert get_cached_response(tmp_path, key) is None
+
+
+def test_cached_response_without_parsed_payload_is_a_miss(tmp_path) -> None:
+    key = build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+    path = tmp_path / key[:2] / f"{key}.json"
+    path.parent.mkdir()
+    path.write_text('{"raw": "{}", "expires_at": 9999999999}', encoding="utf-8")
+
+    assert get_cached_response(tmp_path, key) is None
+
+
+def test_cached_response_with_non_numeric_expiry_is_a_miss(tmp_path) -> None:
+    key = build_cache_key("v1", BASE_URL, "m1", MESSAGES)
+    path = tmp_path / key[:2] / f"{key}.json"
+    path.parent.mkdir()
+
+    for expires_at in ('"2099-01-01"', "null", "true", "[9999999999]"):
+        path.write_text(f'{{"raw": "{{}}", "parsed": {{}}, "expires_at": {expires_at}}}', encoding="utf-8")
+        assert get_cached_response(tmp_path, key) is None
@@ -5,7 +5,31 @@ from pathlib import Path
 import pytest
 
 from proof_please.pipeline.models import ModelBackendConfig
-from proof_please.pipeline.pipeline_runner import run_claim_extraction, run_query_generation
+from proof_please.pipeline.pipeline_runner import (
+    find_missing_models,
+    parse_model_list,
+    run_claim_extraction,
+    run_query_generation,
+)
+
+
+@pytest.mark.parametrize(
+    ("models", "expected"),
+    [
+        ("", []),
+        ("  ", []),
+        (" qwen3:4b ", ["qwen3:4b"]),
+        ("gpt-oss:20b, qwen3:4b,,", ["gpt-oss:20b", "qwen3:4b"]),
+    ],
+)
+def test_parse_model_list_strips_and_drops_empty_names(models: str, expected: list[str]) -> None:
+    assert parse_model_list(models) == expected
+
+
+def test_find_missing_models_keeps_requested_order() -> None:
+    missing = find_missing_models(["b", "a", "c"], ["a", "x"])
+
+    assert missing == ["b", "c"]
 
 
 def test_run_claim_extraction_orchestrates_stage(monkeypatch) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 
@@ -16,3 +17,38 @@ def test_package_cli_help_lists_commands() -> None:
     assert "extract-claims" in output
     assert "generate-queries" in output
     assert "run-pipeline" in output
+
+
+def test_cli_import_defers_command_dependencies() -> None:
+    probe = (
+        "import sys, proof_please.cli; "
+        "heavy = ['duckdb', 'pydantic_settings', 'proof_please.pipeline.pipeline_runner']; "
+        "print(','.join(name for name in heavy if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_init_db_reports_invalid_memory_limit_without_traceback(tmp_path) -> None:
+    env = {
+        **os.environ,
+        "PP_DUCKDB_PATH": str(tmp_path / "test.duckdb"),
+        "PP_DUCKDB_MEMORY_LIMIT": "bogus",
+    }
+    result = subprocess.run(
+        [sys.executable, "-m", "proof_please.cli", "init-db"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+    )
+
+    assert result.returncode == 1
+    assert "Error:" in result.stdout
+    assert "Traceback" not in result.stderr
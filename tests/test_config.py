@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from proof_please.config import AppConfig, get_app_config
+
+
+def test_get_app_config_reads_env_once(monkeypatch) -> None:
+    get_app_config.cache_clear()
+    monkeypatch.setenv("PP_DUCKDB_PATH", "data/first.duckdb")
+    try:
+        first = get_app_config()
+        monkeypatch.setenv("PP_DUCKDB_PATH", "data/second.duckdb")
+
+        assert get_app_config() is first
+        assert first.duckdb_path == "data/first.duckdb"
+    finally:
+        get_app_config.cache_clear()
+
+
+def test_app_config_leaves_duckdb_settings_to_duckdb(monkeypatch) -> None:
+    monkeypatch.delenv("PP_DUCKDB_THREADS", raising=False)
+    monkeypatch.delenv("PP_DUCKDB_MEMORY_LIMIT", raising=False)
+
+    cfg = AppConfig(_env_file=None)
+
+    assert cfg.duckdb_threads is None
+    assert cfg.duckdb_memory_limit is None
+
+    monkeypatch.setenv("PP_DUCKDB_MEMORY_LIMIT", "80%")
+    assert AppConfig().duckdb_memory_limit == "80%"
+
+    monkeypatch.setenv("PP_DUCKDB_THREADS", "0")
+    with pytest.raises(ValidationError, match="duckdb_threads"):
+        AppConfig()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from proof_please.db import get_connection
+
+
+def test_get_connection_applies_thread_and_memory_settings(tmp_path: Path) -> None:
+    conn = get_connection(str(tmp_path / "test.duckdb"), threads=2, memory_limit="512MiB")
+
+    threads = conn.execute("SELECT current_setting('threads')").fetchone()
+    memory_limit = conn.execute("SELECT current_setting('memory_limit')").fetchone()
+
+    assert threads == (2,)
+    assert memory_limit == ("512.0 MiB",)
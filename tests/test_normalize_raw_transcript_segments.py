@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "normalize_raw_transcript_segments.py"
+_spec = importlib.util.spec_from_file_location("normalize_raw_transcript_segments", SCRIPT_PATH)
+normalize_script = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(normalize_script)
+
+
+def _segment_fields(raw_text: str) -> list[tuple[str, int, str]]:
+    return [
+        (segment["speaker"], segment["start_time_s"], segment["text"])
+        for segment in normalize_script.extract_segments(raw_text)
+    ]
+
+
+def test_extract_segments_handles_cr_only_line_endings() -> None:
+    raw_text = "Host: [00:05]\rWelcome back.\rToday we talk LDL.\rGuest: (1:02:03)\rThanks for having me.\r"
+
+    assert _segment_fields(raw_text) == [
+        ("Host", 5, "Welcome back. Today we talk LDL."),
+        ("Guest", 3723, "Thanks for having me."),
+    ]
+
+
+def test_extract_segments_treats_unicode_line_separator_as_line_break() -> None:
+    raw_text = "Host: 00:05\nFirst point.\u2028Guest: 00:10\nSecond point."
+
+    assert _segment_fields(raw_text) == [
+        ("Host", 5, "First point."),
+        ("Guest", 10, "Second point."),
+    ]